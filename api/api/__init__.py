@@ -1 +1,7 @@
 """API top-level package."""
+
+import os
+
+# Must be set before google.protobuf is first imported so the native upb
+# backend is selected instead of the pure-Python runtime.
+os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'upb')
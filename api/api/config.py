@@ -21,6 +21,7 @@ class Settings(pydantic_settings.BaseSettings):
 
     NL_DIMMER_HOST: str = 'dimmer'
     NL_DIMMER_PORT: int = 4000
+    NL_DIMMER_POOL_SIZE: int = 4
 
     CHIRPSTACK_SERVER_URL: str = 'chripstack:3000'
     CHIRPSTACK_SERVER_JWT_TOKEN: str = ''
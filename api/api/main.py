@@ -113,26 +113,25 @@ async def proc_streetlamp_state_batch(
             entries = await api.rs.db.xread(
                 streams={'nl:streetlamp_states': last_id_seen}, count=batch_size
             )
-            n = 0
+            sscs = []
+            item_ids = []
             for _, items in entries:
                 for item_id, item in items:
                     ssc = api.schemas.StreetlampStateCreate.parse_raw(
                         item['value']
                     )
-                    try:
-                        if ssc.data:
-                            ssid = await serv.create(ssc)
-                            if ssid is not None:
-                                n += 1
-                        await api.rs.db.xdel('nl:streetlamp_states', item_id)
-                    except redis.RedisError as e:
-                        api.log.logger.error(
-                            'Failed creating streetlamp states: %s, %s',
-                            ssc,
-                            e,
-                        )
-                    finally:
-                        last_id_seen = item_id
+                    if ssc.data:
+                        sscs.append(ssc)
+                    item_ids.append(item_id)
+
+            n = await serv.create_many(sscs)
+            if item_ids:
+                try:
+                    await api.rs.db.xdel('nl:streetlamp_states', *item_ids)
+                except redis.RedisError as e:
+                    api.log.logger.error(
+                        'Failed deleting processed streetlamp states: %s', e
+                    )
 
             api.log.logger.debug('%s streetlamp state created', n)
     except Exception as e:  # noqa: BLE001
@@ -171,6 +170,9 @@ async def _start() -> None:
     task.add_done_callback(background_tasks.discard)
 
 async def _stop() -> None:
+    api.services._get_dimmer_serv(  # noqa: SLF001
+        settings.NL_DIMMER_HOST, settings.NL_DIMMER_PORT
+    ).close()
     await api.postgres.get_engine().dispose()
     api.log.logger.info('api %s stopped', settings.NL_VERSION)
 
@@ -185,6 +187,7 @@ app = fastapi.FastAPI(
     title='NetoLight',
     description='NetoLight API',
     version=settings.NL_VERSION,
+    default_response_class=fastapi.responses.ORJSONResponse,
 )
 
 # Configurar CORS
@@ -11,6 +11,7 @@ import sqlalchemy.sql.expression
 
 import api.models
 import api.postgres
+import api.schemas
 import api.utils
 
 
@@ -216,6 +217,42 @@ class DimmingEventRepository:
         )
         return (await self.db.execute(s)).scalar()
 
+    async def insert_many(
+        self: Self, des: Sequence[api.models.DimmingEvent]
+    ) -> int:
+        """Insert many dimming events in a single statement."""
+        if not des:
+            return 0
+        s = sa.insert(api.models.DimmingEvent)
+        r = await self.db.execute(
+            s,
+            [
+                {
+                    'account_id': de.account_id,
+                    'dimming_profile_id': de.dimming_profile_id,
+                    'target_id': de.target_id,
+                    'target_type': de.target_type,
+                    'job_id': de.job_id,
+                    'command': de.command,
+                    'start': de.start,
+                    'end': de.end,
+                    'color': de.color,
+                    'text_color': de.text_color,
+                }
+                for de in des
+            ],
+        )
+        return r.rowcount
+
+    async def update_job_id(self: Self, deid: int, job_id: str) -> int:
+        """Update the job ID of a dimming event."""
+        s = (
+            sa.update(api.models.DimmingEvent)
+            .where(api.models.DimmingEvent.id == deid)
+            .values(job_id=job_id)
+        )
+        return (await self.db.execute(s)).rowcount
+
     async def update(self: Self, de: api.models.DimmingEvent) -> bool:
         """Update a dimming event."""
         s = (
@@ -286,6 +323,17 @@ class DimmingProfileRepository:
         s = sa.select(api.models.DimmingProfile).offset(skip).limit(limit)
         return (await self.db.execute(s)).scalars().all()
 
+    async def find_all_rows(
+        self: Self, skip: int = 0, limit: int = 4
+    ) -> Sequence[sa.RowMapping]:
+        """Find a sublist of dimming profiles as column mappings."""
+        s = (
+            sa.select(*api.models.DimmingProfile.__table__.columns)
+            .offset(skip)
+            .limit(limit)
+        )
+        return (await self.db.execute(s)).mappings().all()
+
     async def count(self: Self) -> int:
         """Count all dimming profiles."""
         s = sa.select(sa.func.count(api.models.DimmingProfile.id))
@@ -389,6 +437,15 @@ class StreetlampRepository:
             s = sa.select(api.models.Streetlamp).offset(skip).limit(limit)
         return (await self.db.execute(s)).scalars().all()
 
+    async def find_all_rows(
+        self: Self, skip: int = 0, limit: int | None = None
+    ) -> Sequence[sa.RowMapping]:
+        """Find a sublist of streetlamps as column mappings."""
+        s = sa.select(*api.models.Streetlamp.__table__.columns).offset(skip)
+        if limit is not None:
+            s = s.limit(limit)
+        return (await self.db.execute(s)).mappings().all()
+
     async def count(self: Self) -> int:
         """Count all streetlamps."""
         s = sa.select(sa.func.count(api.models.Streetlamp.id))
@@ -409,6 +466,30 @@ class StreetlampRepository:
         )
         return (await self.db.execute(stmt)).scalar()
 
+    async def insert_many(
+        self: Self, ss: Sequence[api.models.Streetlamp]
+    ) -> Sequence[int]:
+        """Insert many streetlamps in a single statement."""
+        if not ss:
+            return []
+        stmt = sa.insert(api.models.Streetlamp).returning(
+            api.models.Streetlamp.id
+        )
+        r = await self.db.execute(
+            stmt,
+            [
+                {
+                    'account_id': s.account_id,
+                    'device_eui': s.device_eui,
+                    'name': s.name,
+                    'lon': s.lon,
+                    'lat': s.lat,
+                }
+                for s in ss
+            ],
+        )
+        return r.scalars().all()
+
     async def update(self: Self, sid: int, s: api.models.Streetlamp) -> bool:
         """Update a streetlamp."""
         stmt = (
@@ -479,6 +560,23 @@ class StreetlampStateRepository:
         )
         return (await self.db.execute(s)).scalar_one_or_none()
 
+    async def find_latest_by_dev_euis(
+        self: Self, dev_euis: Sequence[str]
+    ) -> Sequence[api.models.StreetlampState]:
+        """Find the latest streetlamp state of each given device."""
+        if not dev_euis:
+            return []
+        s = (
+            sa.select(api.models.StreetlampState)
+            .where(api.models.StreetlampState.dev_eui.in_(dev_euis))
+            .order_by(
+                api.models.StreetlampState.dev_eui,
+                api.models.StreetlampState.time.desc(),
+            )
+            .distinct(api.models.StreetlampState.dev_eui)
+        )
+        return (await self.db.execute(s)).scalars().all()
+
     async def find_by_id(
         self: Self, ssid: int
     ) -> api.models.StreetlampState | None:
@@ -531,6 +629,43 @@ class StreetlampStateRepository:
         )
         return (await self.db.execute(s)).scalar()
 
+    async def insert_many(
+        self: Self, sss: Sequence[api.models.StreetlampState]
+    ) -> Sequence[int]:
+        """Insert many streetlamp states in a single statement."""
+        if not sss:
+            return []
+        s = sa.insert(api.models.StreetlampState).returning(
+            api.models.StreetlampState.id
+        )
+        r = await self.db.execute(
+            s,
+            [
+                {
+                    'deduplication_id': ss.deduplication_id,
+                    'time': ss.time,
+                    'tenant_id': ss.tenant_id,
+                    'tenant_name': ss.tenant_name,
+                    'application_id': ss.application_id,
+                    'application_name': ss.application_name,
+                    'device_profile_id': ss.device_profile_id,
+                    'device_profile_name': ss.device_profile_name,
+                    'device_name': ss.device_name,
+                    'dev_eui': ss.dev_eui,
+                    'dev_addr': ss.dev_addr,
+                    'dev_voltage': ss.dev_voltage,
+                    'dev_current': ss.dev_current,
+                    'dev_energy_out': ss.dev_energy_out,
+                    'dev_energy_in': ss.dev_energy_in,
+                    'dev_power': ss.dev_power,
+                    'dev_frequency': ss.dev_frequency,
+                    'dev_status_on': ss.dev_status_on,
+                }
+                for ss in sss
+            ],
+        )
+        return r.scalars().all()
+
     async def delete_by_id(self: Self, sid: int) -> bool:
         """Delete a streetlamp by ID."""
         s = sa.delete(api.models.StreetlampState).where(
@@ -544,6 +679,30 @@ class StreetlampStateRepository:
         return (await self.db.execute(s)).rowcount
 
 
+_ALARM_INSERT = sa.insert(api.models.StreetlampAlarm)
+_ALARM_INSERT_RETURNING = _ALARM_INSERT.returning(
+    api.models.StreetlampAlarm.id
+)
+
+
+def _alarm_params(sal: api.models.StreetlampAlarm) -> dict:
+    """Build the insert parameters of a streetlamp alarm."""
+    return {
+        'time': sal.time,
+        'atype': sal.atype,
+        'severity': sal.severity,
+        'cleared': sal.cleared,
+        'dev_eui': sal.dev_eui,
+        'dev_voltage': sal.dev_voltage,
+        'dev_current': sal.dev_current,
+        'dev_energy_out': sal.dev_energy_out,
+        'dev_energy_in': sal.dev_energy_in,
+        'dev_power': sal.dev_power,
+        'dev_frequency': sal.dev_frequency,
+        'dev_status_on': sal.dev_status_on,
+    }
+
+
 class StreetlampAlarmRepository:
     """This class represents a streetlamp alarm repository."""
 
@@ -580,25 +739,19 @@ class StreetlampAlarmRepository:
 
     async def insert(self: Self, sal: api.models.StreetlampAlarm) -> int | None:
         """Insert a streetlamp alarm."""
-        s = (
-            sa.insert(api.models.StreetlampAlarm)
-            .values(
-                time=sal.time,
-                atype=sal.atype,
-                severity=sal.severity,
-                cleared=sal.cleared,
-                dev_eui=sal.dev_eui,
-                dev_voltage=sal.dev_voltage,
-                dev_current=sal.dev_current,
-                dev_energy_out=sal.dev_energy_out,
-                dev_energy_in=sal.dev_energy_in,
-                dev_power=sal.dev_power,
-                dev_frequency=sal.dev_frequency,
-                dev_status_on=sal.dev_status_on,
-            )
-            .returning(api.models.StreetlampAlarm.id)
+        r = await self.db.execute(_ALARM_INSERT_RETURNING, _alarm_params(sal))
+        return r.scalar()
+
+    async def insert_many(
+        self: Self, sals: Sequence[api.models.StreetlampAlarm]
+    ) -> int:
+        """Insert many streetlamp alarms in a single statement."""
+        if not sals:
+            return 0
+        r = await self.db.execute(
+            _ALARM_INSERT, [_alarm_params(sal) for sal in sals]
         )
-        return (await self.db.execute(s)).scalar()
+        return r.rowcount
 
     async def delete_by_id(self: Self, said: int) -> bool:
         """Delete a streetlamp by ID."""
@@ -785,6 +938,85 @@ class HourlyStreetlampStateRepository:
 
         return (await self.db.execute(us)).rowcount
 
+    async def pull_many(
+        self: Self,
+        ranges: dict[str, tuple[datetime.datetime, datetime.datetime]],
+    ) -> int:
+        """Pull energy for many devices in a single statement."""
+        if not ranges:
+            return 0
+        src = api.models.StreetlampState
+        tgt = api.models.HourlyStreetlampState
+        rv = sa.values(
+            sa.column('dev_eui', sa.String),
+            sa.column('t0', sa.DateTime(timezone=True)),
+            sa.column('t1', sa.DateTime(timezone=True)),
+            name='ranges',
+        ).data([(e, t0, t1) for e, (t0, t1) in ranges.items()])
+        s = sa.dialects.postgresql.insert(tgt).from_select(
+            [
+                tgt.hour,
+                tgt.dev_eui,
+                tgt.voltage,
+                tgt.current,
+                tgt.energy_out,
+                tgt.energy_in,
+                tgt.power,
+                tgt.frequency,
+                tgt.on_time,
+            ],
+            sa.select(
+                (sa.func.date_trunc('hour', sa.func.min(src.time))).label(
+                    'hour'
+                ),
+                src.dev_eui.label('dev_eui'),
+                sa.func.avg(src.dev_voltage).label('voltage'),
+                sa.func.avg(src.dev_current).label('current'),
+                (
+                    (
+                        sa.func.max(src.dev_energy_out)
+                        - sa.func.min(src.dev_energy_out)
+                    )
+                    / 100.0
+                ).label('energy_out'),
+                (
+                    (
+                        sa.func.max(src.dev_energy_in)
+                        - sa.func.min(src.dev_energy_in)
+                    )
+                    / 100.0
+                ).label('energy_in'),
+                sa.func.avg(src.dev_power).label('power'),
+                sa.func.avg(src.dev_frequency).label('frequency'),
+                (
+                    sa.func.avg(sa.func.cast(src.dev_status_on, sa.Integer))
+                    * sa.func.extract(
+                        'epoch', sa.func.max(src.time) - sa.func.min(src.time)
+                    )
+                ).label('on_time'),
+            )
+            .select_from(src)
+            .join(rv, src.dev_eui == rv.c.dev_eui)
+            .where(src.time.between(rv.c.t0, rv.c.t1))
+            .group_by(src.dev_eui, sa.func.date_trunc('hour', src.time))
+            .order_by('hour'),
+        )
+
+        us = s.on_conflict_do_update(
+            index_elements=['hour', 'dev_eui'],
+            set_={
+                'voltage': s.excluded.voltage,
+                'current': s.excluded.current,
+                'energy_out': s.excluded.energy_out,
+                'energy_in': s.excluded.energy_in,
+                'power': s.excluded.power,
+                'frequency': s.excluded.frequency,
+                'on_time': s.excluded.on_time,
+            },
+        )
+
+        return (await self.db.execute(us)).rowcount
+
     async def day_summary(self: Self, day: datetime.datetime):  # noqa: ANN201
         """Make summary of given day."""
         t = api.models.HourlyStreetlampState
@@ -829,6 +1061,24 @@ class DailyStreetlampStateRepository:
         )
         return (await self.db.execute(s)).scalar_one_or_none()
 
+    async def find_oldest_by_dev_euis(
+        self: Self, dev_euis: Sequence[str]
+    ) -> dict[str, api.models.DailyStreetlampState]:
+        """Find the oldest daily energy row of each given device."""
+        if not dev_euis:
+            return {}
+        s = (
+            sa.select(api.models.DailyStreetlampState)
+            .where(api.models.DailyStreetlampState.dev_eui.in_(dev_euis))
+            .order_by(
+                api.models.DailyStreetlampState.dev_eui,
+                api.models.DailyStreetlampState.day.asc(),
+            )
+            .distinct(api.models.DailyStreetlampState.dev_eui)
+        )
+        dses = (await self.db.execute(s)).scalars().all()
+        return {dse.dev_eui: dse for dse in dses}
+
     async def find_by_id(
         self: Self, dseid: int
     ) -> api.models.DailyStreetlampState | None:
@@ -913,6 +1163,66 @@ class DailyStreetlampStateRepository:
 
         return (await self.db.execute(us)).rowcount
 
+    async def pull_many(
+        self: Self,
+        ranges: dict[str, tuple[datetime.datetime, datetime.datetime]],
+    ) -> int:
+        """Pull energy for many devices in a single statement."""
+        if not ranges:
+            return 0
+        src = api.models.HourlyStreetlampState
+        tgt = api.models.DailyStreetlampState
+        rv = sa.values(
+            sa.column('dev_eui', sa.String),
+            sa.column('t0', sa.DateTime(timezone=True)),
+            sa.column('t1', sa.DateTime(timezone=True)),
+            name='ranges',
+        ).data([(e, t0, t1) for e, (t0, t1) in ranges.items()])
+        s = sa.dialects.postgresql.insert(tgt).from_select(
+            [
+                tgt.day,
+                tgt.dev_eui,
+                tgt.voltage,
+                tgt.current,
+                tgt.energy_out,
+                tgt.energy_in,
+                tgt.power,
+                tgt.frequency,
+                tgt.on_time,
+            ],
+            sa.select(
+                (sa.func.date_trunc('day', sa.func.min(src.hour))).label('day'),
+                src.dev_eui.label('dev_eui'),
+                sa.func.avg(src.voltage).label('voltage'),
+                sa.func.avg(src.current).label('current'),
+                sa.func.sum(src.energy_out).label('energy_out'),
+                sa.func.sum(src.energy_in).label('energy_in'),
+                sa.func.avg(src.power).label('power'),
+                sa.func.avg(src.frequency).label('frequency'),
+                sa.func.sum(src.on_time).label('on_time'),
+            )
+            .select_from(src)
+            .join(rv, src.dev_eui == rv.c.dev_eui)
+            .where(src.hour.between(rv.c.t0, rv.c.t1))
+            .group_by(src.dev_eui, sa.func.date_trunc('day', src.hour))
+            .order_by('day'),
+        )
+
+        us = s.on_conflict_do_update(
+            index_elements=['day', 'dev_eui'],
+            set_={
+                'voltage': s.excluded.voltage,
+                'current': s.excluded.current,
+                'energy_out': s.excluded.energy_out,
+                'energy_in': s.excluded.energy_in,
+                'power': s.excluded.power,
+                'frequency': s.excluded.frequency,
+                'on_time': s.excluded.on_time,
+            },
+        )
+
+        return (await self.db.execute(us)).rowcount
+
     async def summary(self: Self, day: datetime.datetime):  # noqa: ANN201
         """Make summary of given day."""
         t = api.models.DailyStreetlampState
@@ -931,9 +1241,9 @@ class DailyStreetlampStateRepository:
 
         return (await self.db.execute(s)).one()
 
-    async def pointwise_summary(  # noqa: ANN201
+    async def pointwise_summary(
         self: Self, from_: datetime.datetime, to: datetime.datetime
-    ):
+    ) -> list[api.schemas.StreetlampStatePointwiseSummary]:
         """Make summary of given interval."""
         t = api.models.DailyStreetlampState
         s = (
@@ -964,7 +1274,10 @@ class DailyStreetlampStateRepository:
             .order_by(t.day)
         )
 
-        return (await self.db.execute(s)).all()
+        return [
+            api.schemas.StreetlampStatePointwiseSummary.model_construct(**r)
+            for r in (await self.db.execute(s)).mappings().all()
+        ]
 
 
 class WeeklyStreetlampStateRepository:
@@ -1069,6 +1382,68 @@ class WeeklyStreetlampStateRepository:
 
         return (await self.db.execute(us)).rowcount
 
+    async def pull_many(
+        self: Self,
+        ranges: dict[str, tuple[datetime.datetime, datetime.datetime]],
+    ) -> int:
+        """Pull energy for many devices in a single statement."""
+        if not ranges:
+            return 0
+        src = api.models.DailyStreetlampState
+        tgt = api.models.WeeklyStreetlampState
+        rv = sa.values(
+            sa.column('dev_eui', sa.String),
+            sa.column('t0', sa.DateTime(timezone=True)),
+            sa.column('t1', sa.DateTime(timezone=True)),
+            name='ranges',
+        ).data([(e, t0, t1) for e, (t0, t1) in ranges.items()])
+        s = sa.dialects.postgresql.insert(tgt).from_select(
+            [
+                tgt.week,
+                tgt.dev_eui,
+                tgt.voltage,
+                tgt.current,
+                tgt.energy_out,
+                tgt.energy_in,
+                tgt.power,
+                tgt.frequency,
+                tgt.on_time,
+            ],
+            sa.select(
+                (sa.func.date_trunc('week', sa.func.min(src.day))).label(
+                    'week'
+                ),
+                src.dev_eui.label('dev_eui'),
+                sa.func.avg(src.voltage).label('voltage'),
+                sa.func.avg(src.current).label('current'),
+                sa.func.sum(src.energy_out).label('energy_out'),
+                sa.func.sum(src.energy_in).label('energy_in'),
+                sa.func.avg(src.power).label('power'),
+                sa.func.avg(src.frequency).label('frequency'),
+                sa.func.sum(src.on_time).label('on_time'),
+            )
+            .select_from(src)
+            .join(rv, src.dev_eui == rv.c.dev_eui)
+            .where(src.day.between(rv.c.t0, rv.c.t1))
+            .group_by(src.dev_eui, sa.func.date_trunc('week', src.day))
+            .order_by('week'),
+        )
+
+        us = s.on_conflict_do_update(
+            index_elements=['week', 'dev_eui'],
+            set_={
+                'voltage': s.excluded.voltage,
+                'current': s.excluded.current,
+                'energy_out': s.excluded.energy_out,
+                'energy_in': s.excluded.energy_in,
+                'power': s.excluded.power,
+                'frequency': s.excluded.frequency,
+                'on_time': s.excluded.on_time,
+            },
+        )
+
+        return (await self.db.execute(us)).rowcount
+
     async def summary(self: Self, week: datetime.datetime):  # noqa: ANN201
         """Make summary of given week."""
         t = api.models.WeeklyStreetlampState
@@ -1088,9 +1463,9 @@ class WeeklyStreetlampStateRepository:
 
         return (await self.db.execute(s)).one()
 
-    async def pointwise_summary(  # noqa: ANN201
+    async def pointwise_summary(
         self: Self, from_: datetime.datetime, to: datetime.datetime
-    ):
+    ) -> list[api.schemas.StreetlampStatePointwiseSummary]:
         """Make summary of given interval."""
         t = api.models.WeeklyStreetlampState
         s = (
@@ -1121,7 +1496,10 @@ class WeeklyStreetlampStateRepository:
             .order_by(t.week)
         )
 
-        return (await self.db.execute(s)).all()
+        return [
+            api.schemas.StreetlampStatePointwiseSummary.model_construct(**r)
+            for r in (await self.db.execute(s)).mappings().all()
+        ]
 
 
 class MonthlyStreetlampStateRepository:
@@ -1210,6 +1588,68 @@ class MonthlyStreetlampStateRepository:
 
         return (await self.db.execute(us)).rowcount
 
+    async def pull_many(
+        self: Self,
+        ranges: dict[str, tuple[datetime.datetime, datetime.datetime]],
+    ) -> int:
+        """Pull energy for many devices in a single statement."""
+        if not ranges:
+            return 0
+        src = api.models.DailyStreetlampState
+        tgt = api.models.MonthlyStreetlampState
+        rv = sa.values(
+            sa.column('dev_eui', sa.String),
+            sa.column('t0', sa.DateTime(timezone=True)),
+            sa.column('t1', sa.DateTime(timezone=True)),
+            name='ranges',
+        ).data([(e, t0, t1) for e, (t0, t1) in ranges.items()])
+        s = sa.dialects.postgresql.insert(tgt).from_select(
+            [
+                tgt.month,
+                tgt.dev_eui,
+                tgt.voltage,
+                tgt.current,
+                tgt.energy_out,
+                tgt.energy_in,
+                tgt.power,
+                tgt.frequency,
+                tgt.on_time,
+            ],
+            sa.select(
+                (sa.func.date_trunc('month', sa.func.min(src.day))).label(
+                    'month'
+                ),
+                src.dev_eui.label('dev_eui'),
+                sa.func.avg(src.voltage).label('voltage'),
+                sa.func.avg(src.current).label('current'),
+                sa.func.sum(src.energy_out).label('energy_out'),
+                sa.func.sum(src.energy_in).label('energy_in'),
+                sa.func.avg(src.power).label('power'),
+                sa.func.avg(src.frequency).label('frequency'),
+                sa.func.sum(src.on_time).label('on_time'),
+            )
+            .select_from(src)
+            .join(rv, src.dev_eui == rv.c.dev_eui)
+            .where(src.day.between(rv.c.t0, rv.c.t1))
+            .group_by(src.dev_eui, sa.func.date_trunc('month', src.day))
+            .order_by('month'),
+        )
+
+        us = s.on_conflict_do_update(
+            index_elements=['month', 'dev_eui'],
+            set_={
+                'voltage': s.excluded.voltage,
+                'current': s.excluded.current,
+                'energy_out': s.excluded.energy_out,
+                'energy_in': s.excluded.energy_in,
+                'power': s.excluded.power,
+                'frequency': s.excluded.frequency,
+                'on_time': s.excluded.on_time,
+            },
+        )
+
+        return (await self.db.execute(us)).rowcount
+
     async def summary(self: Self, month: datetime.datetime):  # noqa: ANN201
         """Make summary of given month."""
         t = api.models.MonthlyStreetlampState
@@ -1229,9 +1669,9 @@ class MonthlyStreetlampStateRepository:
 
         return (await self.db.execute(s)).one()
 
-    async def pointwise_summary(  # noqa: ANN201
+    async def pointwise_summary(
         self: Self, from_: datetime.datetime, to: datetime.datetime
-    ):
+    ) -> list[api.schemas.StreetlampStatePointwiseSummary]:
         """Make summary of given interval."""
         t = api.models.MonthlyStreetlampState
         s = (
@@ -1262,7 +1702,10 @@ class MonthlyStreetlampStateRepository:
             .order_by(t.month)
         )
 
-        return (await self.db.execute(s)).all()
+        return [
+            api.schemas.StreetlampStatePointwiseSummary.model_construct(**r)
+            for r in (await self.db.execute(s)).mappings().all()
+        ]
 
 
 class StreamStateRepository:
@@ -1284,6 +1727,20 @@ class StreamStateRepository:
         )
         return (await self.db.execute(s)).scalar()
 
+    async def find_by_names(
+        self: Self, names: Sequence[str]
+    ) -> dict[str, api.models.StreamState]:
+        """Find many stream states by name, keyed by lowercased name."""
+        if not names:
+            return {}
+        s = sa.select(api.models.StreamState).where(
+            sa.func.lower(api.models.StreamState.name).in_(
+                [name.lower() for name in names]
+            )
+        )
+        sss = (await self.db.execute(s)).scalars().all()
+        return {ss.name.lower(): ss for ss in sss}
+
     async def delete_by_name(self: Self, name: str) -> int:
         """Delete a stream state by name."""
         s = sa.delete(api.models.StreamState).where(
@@ -1323,6 +1780,26 @@ class StreamStateRepository:
         )
         return (await self.db.execute(s)).rowcount
 
+    async def update_producers(
+        self: Self, producer_tss: dict[str, datetime.datetime]
+    ) -> int:
+        """Update many stream state producer timestamps in one upsert."""
+        if not producer_tss:
+            return 0
+        s = sqlalchemy.dialects.postgresql.insert(api.models.StreamState)
+        s = s.on_conflict_do_update(
+            index_elements=['name'],
+            set_={'producer_ts': s.excluded.producer_ts},
+        )
+        r = await self.db.execute(
+            s,
+            [
+                {'name': name, 'producer_ts': producer_ts}
+                for name, producer_ts in producer_tss.items()
+            ],
+        )
+        return r.rowcount
+
     async def update_consumer(
         self: Self,
         name: str,
@@ -1335,3 +1812,21 @@ class StreamStateRepository:
             .where(api.models.StreamState.name == name)
         )
         return (await self.db.execute(s)).rowcount
+
+    async def update_consumers(
+        self: Self, consumer_tss: dict[str, datetime.datetime]
+    ) -> int:
+        """Update many stream state consumer timestamps in one statement."""
+        if not consumer_tss:
+            return 0
+        cv = sa.values(
+            sa.column('name', sa.String),
+            sa.column('consumer_ts', sa.DateTime(timezone=True)),
+            name='consumer_tss',
+        ).data(list(consumer_tss.items()))
+        s = (
+            sa.update(api.models.StreamState)
+            .values(consumer_ts=cv.c.consumer_ts)
+            .where(api.models.StreamState.name == cv.c.name)
+        )
+        return (await self.db.execute(s)).rowcount
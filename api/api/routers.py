@@ -192,11 +192,11 @@ async def send_command(
     if current_user.role == 'super-admin':
         match command.command.lower().split('_'):
             case ['turn', 'on']:
-                streetlamp_device_serv.turn_on(dev_eui)
+                await streetlamp_device_serv.turn_on(dev_eui)
             case ['turn', 'off']:
-                streetlamp_device_serv.turn_off(dev_eui)
+                await streetlamp_device_serv.turn_off(dev_eui)
             case ['dim', val]:
-                streetlamp_device_serv.dim(dev_eui, int(val))
+                await streetlamp_device_serv.dim(dev_eui, int(val))
     else:
         raise fastapi.HTTPException(
             status_code=fastapi.status.HTTP_403_FORBIDDEN
@@ -218,7 +218,7 @@ async def send_raw_command(
 ) -> None:
     """Send raw command."""
     if current_user.role == 'super-admin':
-        streetlamp_device_serv.enqueue_command(
+        await streetlamp_device_serv.enqueue_command(
             dev_eui, command.command.encode('utf-8')
         )
     else:
@@ -234,7 +234,11 @@ dimming_events = fastapi.APIRouter(
 )
 
 
-@dimming_events.get('/')
+@dimming_events.get(
+    '/',
+    response_model=None,
+    responses={200: {'model': api.schemas.DimmingEventList}},
+)
 async def get_dimming_events(
     current_user: Annotated[  # noqa: ARG001
         api.schemas.User,
@@ -274,7 +278,11 @@ dimming_profiles = fastapi.APIRouter(
 )
 
 
-@dimming_profiles.get('/')
+@dimming_profiles.get(
+    '/',
+    response_model=None,
+    responses={200: {'model': api.schemas.DimmingProfileList}},
+)
 async def get_dimming_profiles(
     current_user: Annotated[  # noqa: ARG001
         api.schemas.User,
@@ -385,7 +393,11 @@ gateways = fastapi.APIRouter(
 )
 
 
-@gateways.get('')
+@gateways.get(
+    '',
+    response_model=None,
+    responses={200: {'model': api.schemas.GatewayList}},
+)
 async def get_gateways(
     current_user: Annotated[  # noqa: ARG001
         api.schemas.User,
@@ -399,7 +411,7 @@ async def get_gateways(
     limit: int | None = 4,
 ) -> api.schemas.GatewayList:
     """Get a sublist of gateways."""
-    r = gateway_serv.reads(skip or 0, limit or 4)
+    r = await gateway_serv.reads(skip or 0, limit or 4)
     gs = [_gateway_from_cs(g) for g in r.get('result', [])]
     return api.schemas.GatewayList(total=r.get('totalCount', 0), data=gs)
 
@@ -423,7 +435,7 @@ async def create_gateway(
     """Create a gateway."""
     if a := await account_serv.get(current_user.account_id):
         return {
-            'id': gateway_serv.create(
+            'id': await gateway_serv.create(
                 a.cs_tenant_id, gateway.id, gateway.name, gateway.description
             )
         }
@@ -443,7 +455,7 @@ async def get_gateway(
     ],
 ) -> api.schemas.Gateway | None:
     """Get a gateway by ID."""
-    r = gateway_serv.read(gid)
+    r = await gateway_serv.read(gid)
     if r is not None and 'gateway' in r and r['gateway'] is not None:
         return _gateway_from_cs(r['gateway'])
     return None
@@ -479,7 +491,7 @@ async def update_gateway(
     """Update a gateway."""
     if a := await account_serv.get(current_user.account_id):
         return {
-            'id': gateway_serv.update(
+            'id': await gateway_serv.update(
                 a.cs_tenant_id, gid, gateway.name, gateway.description
             )
         }
@@ -498,7 +510,7 @@ async def delete_gateway(
     ],
 ) -> dict:
     """Delete a gateway."""
-    gateway_serv.delete(gid)
+    await gateway_serv.delete(gid)
     return {'deleted': gid}
 
 
@@ -521,7 +533,11 @@ async def create_streetlamp_state(
         await serv.enqueue_create(await req.body())
 
 
-@streetlamp_states.get('/latest')
+@streetlamp_states.get(
+    '/latest',
+    response_model=None,
+    responses={200: {'model': api.schemas.StreetlampState}},
+)
 async def get_latest_streetlamp_state(
     dev_eui: str,
     current_user: Annotated[
@@ -633,7 +649,11 @@ async def delete_streetlamp(
     return {'deleted': await serv.delete_by_id(sid)}
 
 
-@streetlamps.get('')
+@streetlamps.get(
+    '',
+    response_model=None,
+    responses={200: {'model': api.schemas.StreetlampList}},
+)
 async def get_streetlamps(
     current_user: Annotated[  # noqa: ARG001
         api.schemas.User,
@@ -656,7 +676,11 @@ dashboards = fastapi.APIRouter(
 )
 
 
-@dashboards.get('/me')
+@dashboards.get(
+    '/me',
+    response_model=None,
+    responses={200: {'model': api.schemas.Dashboard}},
+)
 async def get_dashboards(
     current_user: Annotated[
         api.schemas.User,
@@ -1,7 +1,9 @@
 """This module provides the schemas."""
 
 import datetime
-from typing import Literal
+import enum
+import json
+from typing import Generic, NamedTuple, Self, TypeVar
 
 import pydantic
 import pydantic.alias_generators
@@ -9,6 +11,39 @@ import pydantic.alias_generators
 import api.models
 
 
+_datetime = pydantic.TypeAdapter(datetime.datetime)
+
+
+def validate_datetime(value: str | datetime.datetime) -> datetime.datetime:
+    """Validate a datetime with the shared module-level adapter."""
+    return _datetime.validate_python(value)
+
+
+class _FromRowMixin:
+    """Mixin providing unvalidated conversion from trusted ORM rows."""
+
+    @classmethod
+    def from_row_unchecked(cls: type[Self], row: object) -> Self:
+        """Build an instance from a row we inserted ourselves.
+
+        The row values already went through validation on the write path,
+        so model_construct() skips re-validating every field.
+        """
+        return cls.model_construct(  # type: ignore[attr-defined]
+            **{f: getattr(row, f) for f in cls.model_fields}  # type: ignore[attr-defined]
+        )
+
+
+T = TypeVar('T')
+
+
+class Page(pydantic.BaseModel, Generic[T]):
+    """This class represents a sublist of items with its total count."""
+
+    total: int
+    data: list[T]
+
+
 class AccountCreate(pydantic.BaseModel):
     """This class represents a request to create an account."""
 
@@ -20,12 +55,12 @@ class AccountUpdate(pydantic.BaseModel):
     """This class represents a request to update an account."""
 
     name: str
-    cs_tenant_id: str | None
-    cs_application_id: str | None
-    cs_streetlamp_dp_id: str | None
+    cs_tenant_id: str | None = None
+    cs_application_id: str | None = None
+    cs_streetlamp_dp_id: str | None = None
 
 
-class Account(pydantic.BaseModel):
+class Account(pydantic.BaseModel, _FromRowMixin):
     """This class represents an account."""
 
     id: int
@@ -38,11 +73,15 @@ class Account(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(from_attributes=True)
 
 
-class AccountList(pydantic.BaseModel):
-    """This class represents a sublist of the accounts."""
+AccountList = Page[Account]
 
-    total: int
-    data: list[Account]
+
+class Role(enum.StrEnum):
+    """This class represents a user role."""
+
+    SUPER_ADMIN = 'super-admin'
+    ADMIN = 'admin'
+    USER = 'user'
 
 
 class UserBase(pydantic.BaseModel):
@@ -52,7 +91,7 @@ class UserBase(pydantic.BaseModel):
     first_name: str
     last_name: str
     email: pydantic.EmailStr
-    role: Literal['super-admin', 'admin', 'user'] = 'user'
+    role: Role = Role.USER
 
 
 class UserCreate(UserBase):
@@ -65,18 +104,14 @@ class UserUpdate(UserBase):
     """This class represents a request to update an user."""
 
 
-class User(UserBase):
+class User(UserBase, _FromRowMixin):
     """This class represents an user."""
 
     id: int
     is_active: bool
 
 
-class UserList(pydantic.BaseModel):
-    """This class represents a sublist of users."""
-
-    total: int
-    data: list[User]
+UserList = Page[User]
 
 
 class Token(pydantic.BaseModel):
@@ -101,6 +136,20 @@ class ChirpStackError(pydantic.BaseModel):
     details: list[str]
 
 
+_CS_ERROR_TEMPLATE = (
+    b'{"error":"chirpstack","code":%d,"message":%s,"details":[]}'
+)
+
+
+def cs_error_bytes(code: int, message: str) -> bytes:
+    """Serialize a ChirpStackError body without building the model.
+
+    Error responses are all shaped alike, so the static parts are baked
+    into a bytes template and only the variable fields are interpolated.
+    """
+    return _CS_ERROR_TEMPLATE % (code, json.dumps(message).encode())
+
+
 class ChirpStackTenantCreate(pydantic.BaseModel):
     """This class represents a request to create ChirpStack tenant."""
 
@@ -145,19 +194,17 @@ class DimmingEventUpdate(DimmingEventBase):
     """This class represents a request to update a dimming event."""
 
 
-class DimmingEvent(DimmingEventBase):
+class DimmingEvent(DimmingEventBase, _FromRowMixin):
     """This class represents a dimming event."""
 
     id: int
 
-    model_config = pydantic.ConfigDict(from_attributes=True)
-
+    model_config = pydantic.ConfigDict(
+        from_attributes=True, cache_strings='all'
+    )
 
-class DimmingEventList(pydantic.BaseModel):
-    """This class represents a sublist of dimming events."""
 
-    total: int
-    data: list[DimmingEvent]
+DimmingEventList = Page[DimmingEvent]
 
 
 class DimmingProfileBase(pydantic.BaseModel):
@@ -188,7 +235,7 @@ class DimmingProfileUpdate(DimmingProfileBase):
     """This class represents a request to update a dimming profile."""
 
 
-class DimmingProfile(DimmingProfileBase):
+class DimmingProfile(DimmingProfileBase, _FromRowMixin):
     """This class represents a dimming profile."""
 
     id: int
@@ -196,11 +243,7 @@ class DimmingProfile(DimmingProfileBase):
     model_config = pydantic.ConfigDict(from_attributes=True)
 
 
-class DimmingProfileList(pydantic.BaseModel):
-    """This class represents a sublist of dimming profiles."""
-
-    total: int
-    data: list[DimmingProfile]
+DimmingProfileList = Page[DimmingProfile]
 
 
 class GatewayBase(pydantic.BaseModel):
@@ -208,7 +251,7 @@ class GatewayBase(pydantic.BaseModel):
 
     id: str
     name: str
-    description: str | None
+    description: str | None = None
     region_id: str | None = None
     region_common_name: str | None = None
 
@@ -219,31 +262,25 @@ class GatewayCreate(GatewayBase):
 
 class GatewayUpdate(GatewayBase):
     """This class represents a request to update a gateway."""
-    name: str
-    description: str | None = None
 
 
 class Gateway(GatewayBase):
     """This class represents a gateway."""
 
-    last_seen: datetime.datetime | None
+    last_seen: datetime.datetime | None = None
     state: str
 
 
-class GatewayList(pydantic.BaseModel):
-    """This class represents a sublist of gateways."""
-
-    total: int
-    data: list[Gateway]
+GatewayList = Page[Gateway]
 
 
-class StreamState(pydantic.BaseModel):
+class StreamState(pydantic.BaseModel, _FromRowMixin):
     """This class represents the state of a stream."""
 
     id: int
     name: str
-    producer_ts: datetime.datetime | None
-    consumer_ts: datetime.datetime | None
+    producer_ts: datetime.datetime | None = None
+    consumer_ts: datetime.datetime | None = None
 
     model_config = pydantic.ConfigDict(from_attributes=True)
 
@@ -268,7 +305,7 @@ class StreetlampUpdate(StreetlampBase):
     """This class represents a request to update a streetlamp."""
 
 
-class Streetlamp(StreetlampBase):
+class Streetlamp(StreetlampBase, _FromRowMixin):
     """This class represents a streetlamp."""
 
     id: int
@@ -276,11 +313,7 @@ class Streetlamp(StreetlampBase):
     model_config = pydantic.ConfigDict(from_attributes=True)
 
 
-class StreetlampList(pydantic.BaseModel):
-    """This class represents a sublist of streetlamps."""
-
-    total: int
-    data: list[Streetlamp]
+StreetlampList = Page[Streetlamp]
 
 
 class StreetlampInfo(pydantic.BaseModel):
@@ -298,7 +331,8 @@ class StreetlampInfo(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         alias_generator=pydantic.AliasGenerator(
             validation_alias=pydantic.alias_generators.to_camel
-        )
+        ),
+        cache_strings='all',
     )
 
 
@@ -314,7 +348,8 @@ class StreetlampStateCreate(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         alias_generator=pydantic.AliasGenerator(
             validation_alias=pydantic.alias_generators.to_camel
-        )
+        ),
+        cache_strings='all',
     )
 
 
@@ -330,7 +365,7 @@ class StreetlampDeviceState(pydantic.BaseModel):
     status_on: bool
 
 
-class StreetlampState(pydantic.BaseModel):
+class StreetlampState(pydantic.BaseModel, _FromRowMixin):
     """This class represents a streetlamp state."""
 
     id: int
@@ -352,15 +387,30 @@ class StreetlampState(pydantic.BaseModel):
     dev_frequency: float
     dev_status_on: bool
 
+    model_config = pydantic.ConfigDict(cache_strings='all')
 
-class StreetlampStateList(pydantic.BaseModel):
-    """This class represents a sublist of streetlamp states."""
 
-    total: int
-    data: list[StreetlampState]
+StreetlampStateList = Page[StreetlampState]
+
+
+_streetlamp_states = pydantic.TypeAdapter(list[StreetlampState])
+
 
+def streetlamp_state_list_bytes(
+    total: int, data: list[StreetlampState]
+) -> bytes:
+    """Serialize a streetlamp state sublist as StreetlampStateList JSON.
 
-class StreetlampStateSummary(pydantic.BaseModel):
+    Large state sublists are serialized in one pass by pydantic-core,
+    skipping the intermediate wrapper model build.
+    """
+    return b'{"total":%d,"data":%s}' % (
+        total,
+        _streetlamp_states.dump_json(data),
+    )
+
+
+class StreetlampStateSummary(pydantic.BaseModel, _FromRowMixin):
     """This class represents a streetlamp state."""
 
     ndevices: int
@@ -453,13 +503,13 @@ class StreetlampEnergyPoint(pydantic.BaseModel):
     co2_savings: float
 
 
-class StreetlampGeoState(pydantic.BaseModel):
+class StreetlampGeoState(NamedTuple):
     """This class represents the state summary ."""
 
     name: str
     dev_eui: str
-    lon: float | None
-    lat: float | None
+    lon: float | None = None
+    lat: float | None = None
 
 
 class DeviceCommand(pydantic.BaseModel):
@@ -482,3 +532,10 @@ class Dashboard(pydantic.BaseModel):
     mtd_weekly_energy: list[StreetlampEnergyPoint]
     ytd_monthly_energy: list[StreetlampEnergyPoint]
     geo_states: list[StreetlampGeoState]
+
+    @pydantic.field_serializer('geo_states')
+    def _serialize_geo_states(
+        self: Self, geo_states: list[StreetlampGeoState]
+    ) -> list[dict]:
+        """Serialize geo states as objects to keep the JSON shape."""
+        return [g._asdict() for g in geo_states]
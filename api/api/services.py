@@ -2,25 +2,30 @@
 
 import asyncio
 import base64
+import contextlib
 import csv
 import dataclasses
 import datetime
 import enum
+import functools
 import io
-import math
+import itertools
+import queue
 import struct
+import time
 import zoneinfo
-from collections.abc import Sequence
-from typing import Annotated, Any, Self
+from collections.abc import Callable, Sequence
+from typing import Annotated, Any, ClassVar, Self
 
+import bcrypt
 import chirpstack_api.api  # type: ignore[import-untyped]
-import dateutil.parser
 import fastapi.security
+import google.protobuf.internal.api_implementation
 import google.protobuf.json_format
 import grpc  # type: ignore[import-untyped]
-import jose.jwt
-import passlib.context
-import pytz
+import jwt
+import pydantic
+import redis.asyncio as redis
 import rpyc  # type: ignore[import-untyped]
 import sqlalchemy.exc
 
@@ -30,48 +35,172 @@ import api.repositories
 import api.rs
 import api.schemas
 
+_CHANNEL_POOL_SIZE = 4
+
+_COUNT_DEVICES_REQ = chirpstack_api.api.ListDevicesRequest(offset=0, limit=1)
+_COUNT_MULTICAST_GROUPS_REQ = chirpstack_api.api.ListMulticastGroupsRequest(
+    offset=0, limit=1
+)
+_PROBE_TENANTS_REQ = chirpstack_api.api.ListTenantsRequest(offset=0, limit=1)
+
+_STATE_TTL_SECONDS = 30.0
+
+_DEVICE_PROFILE_TTL_SECONDS = 30.0
+
+_GEO_STATES_TTL_SECONDS = 5.0
+
+_TZ_SANTO_DOMINGO = zoneinfo.ZoneInfo('America/Santo_Domingo')
+
+_TYPE_ADAPTERS: dict[type, pydantic.TypeAdapter] = {}
+
+
+def _adapter(cls: type) -> pydantic.TypeAdapter:
+    """Get the cached TypeAdapter for a schema class."""
+    if (adapter := _TYPE_ADAPTERS.get(cls)) is None:
+        adapter = _TYPE_ADAPTERS[cls] = pydantic.TypeAdapter(cls)
+    return adapter
+
+
+def _dimming_dispatch() -> dict[
+    api.models.DimmingCommand, tuple[str, str, int | None]
+]:
+    """Precompute dimmer job names and dim values per command."""
+    table = {}
+    for cmd in api.models.DimmingCommand:
+        if cmd.value.startswith('dim'):
+            table[cmd] = (
+                'dimmer:commands.dim',
+                'dimmer:commands.dim_group',
+                int(cmd.value.split('_')[1]),
+            )
+        else:
+            table[cmd] = (
+                f'dimmer:commands.{cmd.value}',
+                f'dimmer:commands.{cmd.value}_group',
+                None,
+            )
+    return table
+
+
+_DIMMING_DISPATCH = _dimming_dispatch()
+
+_USER_LIST_ADAPTER = pydantic.TypeAdapter(list[api.schemas.User])
+_DIMMING_EVENT_LIST_ADAPTER = pydantic.TypeAdapter(
+    list[api.schemas.DimmingEvent]
+)
+
+if google.protobuf.internal.api_implementation.Type() != 'upb':
+    api.log.logger.warning(
+        'protobuf is using the %s backend instead of upb',
+        google.protobuf.internal.api_implementation.Type(),
+    )
+
+
+def _gateway_item_to_dict(g) -> dict:  # noqa: ANN001
+    """Convert a gateway list item to its MessageToDict-shaped dict."""
+    d = {
+        'tenantId': g.tenant_id,
+        'gatewayId': g.gateway_id,
+        'name': g.name,
+    }
+    if g.description:
+        d['description'] = g.description
+    if g.state:
+        d['state'] = chirpstack_api.api.GatewayState.Name(g.state)
+    if g.HasField('last_seen_at'):
+        d['lastSeenAt'] = g.last_seen_at.ToJsonString()
+    return d
+
+
+def _device_item_to_dict(d) -> dict:  # noqa: ANN001
+    """Convert a device list item to its MessageToDict-shaped dict."""
+    x = {
+        'devEui': d.dev_eui,
+        'name': d.name,
+        'deviceProfileId': d.device_profile_id,
+        'deviceProfileName': d.device_profile_name,
+    }
+    if d.description:
+        x['description'] = d.description
+    if d.HasField('last_seen_at'):
+        x['lastSeenAt'] = d.last_seen_at.ToJsonString()
+    if d.HasField('device_status'):
+        x['deviceStatus'] = {
+            'margin': d.device_status.margin,
+            'externalPowerSource': d.device_status.external_power_source,
+            'batteryLevel': d.device_status.battery_level,
+        }
+    return x
+
 
 class _TenantService:
     """This class provides functions for managing tenants."""
 
     def __init__(
-        self: Self, channel: grpc.Channel, token: list[tuple[str, str]]
+        self: Self,
+        get_channel: Callable[[], grpc.aio.Channel],
+        token: tuple[tuple[str, str], ...],
     ) -> None:
-        """Initialize channel and token properties."""
-        self.channel = channel
+        """Initialize channel accessor and token properties."""
+        self.get_channel = get_channel
         self.token = token
+        self._stub: chirpstack_api.api.TenantServiceStub | None = None
 
-    def reads(self: Self, offset: int = 0, limit: int = 10) -> dict[str, Any]:
+    def _client(self: Self) -> chirpstack_api.api.TenantServiceStub:
+        """Get the memoized service stub."""
+        if self._stub is None:
+            self._stub = chirpstack_api.api.TenantServiceStub(
+                self.get_channel()
+            )
+        return self._stub
+
+    async def reads(
+        self: Self, offset: int = 0, limit: int = 10
+    ) -> dict[str, Any]:
         """Read a sublist of tenants."""
-        client = chirpstack_api.api.TenantServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.ListTenantsRequest()
         req.offset = offset
         req.limit = limit
-        resp = client.List(req, metadata=self.token)
-        return google.protobuf.json_format.MessageToDict(resp)
+        resp = await client.List(req, metadata=self.token)
+        return {
+            'totalCount': resp.total_count,
+            'result': [{'id': t.id, 'name': t.name} for t in resp.result],
+        }
 
-    def read(self: Self, tenant_id: str) -> dict | None:
+    async def read(self: Self, tenant_id: str) -> dict | None:
         """Read a tenants."""
-        client = chirpstack_api.api.TenantServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.GetTenantRequest()
         req.id = tenant_id
         try:
-            resp = client.Get(req, metadata=self.token)
-            return google.protobuf.json_format.MessageToDict(resp)['tenant']
-        except grpc.RpcError as e:
+            resp = await client.Get(req, metadata=self.token)
+        except grpc.aio.AioRpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
                 return None
             raise
-
-    def create(self: Self, name: str, description: str) -> dict:
+        t = resp.tenant
+        return {
+            'id': t.id,
+            'name': t.name,
+            'description': t.description,
+            'canHaveGateways': t.can_have_gateways,
+            'maxGatewayCount': t.max_gateway_count,
+            'maxDeviceCount': t.max_device_count,
+        }
+
+    async def create(self: Self, name: str, description: str) -> dict:
         """Create a tenant."""
-        client = chirpstack_api.api.TenantServiceStub(self.channel)
-        req = chirpstack_api.api.CreateTenantRequest()
-        req.tenant.name = name
-        req.tenant.description = description
-        req.tenant.can_have_gateways = True
-        req.tenant.max_device_count = 0
-        resp = client.Create(req, metadata=self.token)
+        client = self._client()
+        req = chirpstack_api.api.CreateTenantRequest(
+            tenant=chirpstack_api.api.Tenant(
+                name=name,
+                description=description,
+                can_have_gateways=True,
+                max_device_count=0,
+            )
+        )
+        resp = await client.Create(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
 
@@ -79,71 +208,97 @@ class _ApplicationService:
     """This class provides functions for managing applications."""
 
     def __init__(
-        self: Self, channel: grpc.Channel, token: list[tuple[str, str]]
+        self: Self,
+        get_channel: Callable[[], grpc.aio.Channel],
+        token: tuple[tuple[str, str], ...],
     ) -> None:
-        """Initialize channel and token properties."""
-        self.channel = channel
+        """Initialize channel accessor and token properties."""
+        self.get_channel = get_channel
         self.token = token
+        self._stub: chirpstack_api.api.ApplicationServiceStub | None = None
+
+    def _client(self: Self) -> chirpstack_api.api.ApplicationServiceStub:
+        """Get the memoized service stub."""
+        if self._stub is None:
+            self._stub = chirpstack_api.api.ApplicationServiceStub(
+                self.get_channel()
+            )
+        return self._stub
 
-    def reads(self: Self, offset: int = 0, limit: int = 10) -> dict[str, Any]:
+    async def reads(
+        self: Self, offset: int = 0, limit: int = 10
+    ) -> dict[str, Any]:
         """Read a sublist of applications."""
-        client = chirpstack_api.api.ApplicationServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.ListApplicationsRequest()
         req.offset = offset
         req.limit = limit
-        resp = client.List(req, metadata=self.token)
-        return google.protobuf.json_format.MessageToDict(resp)
+        resp = await client.List(req, metadata=self.token)
+        return {
+            'totalCount': resp.total_count,
+            'result': [{'id': a.id, 'name': a.name} for a in resp.result],
+        }
 
-    def read(self: Self, application_id: str) -> dict | None:
+    async def read(self: Self, application_id: str) -> dict | None:
         """Read an application."""
-        client = chirpstack_api.api.ApplicationServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.GetApplicationRequest()
         req.id = application_id
         try:
-            resp = client.Get(req, metadata=self.token)
-            return google.protobuf.json_format.MessageToDict(resp)[
-                'application'
-            ]
-        except grpc.RpcError as e:
+            resp = await client.Get(req, metadata=self.token)
+        except grpc.aio.AioRpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
                 return None
             raise
+        a = resp.application
+        return {
+            'id': a.id,
+            'name': a.name,
+            'description': a.description,
+            'tenantId': a.tenant_id,
+        }
 
-    def create(self: Self, tenant_id: str, name: str, description: str) -> dict:
+    async def create(
+        self: Self, tenant_id: str, name: str, description: str
+    ) -> dict:
         """Create an application."""
-        client = chirpstack_api.api.ApplicationServiceStub(self.channel)
-        req = chirpstack_api.api.CreateApplicationRequest()
-        req.application.name = name
-        req.application.description = description
-        req.application.tenant_id = tenant_id
-        resp = client.Create(req, metadata=self.token)
+        client = self._client()
+        req = chirpstack_api.api.CreateApplicationRequest(
+            application=chirpstack_api.api.Application(
+                name=name, description=description, tenant_id=tenant_id
+            )
+        )
+        resp = await client.Create(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
-    def get_http_integration(self: Self, app_id: str) -> dict | None:
+    async def get_http_integration(self: Self, app_id: str) -> dict | None:
         """Get a HTTP application."""
-        client = chirpstack_api.api.ApplicationServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.GetHttpIntegrationRequest()
         req.application_id = app_id
         try:
-            resp = client.GetHttpIntegration(req, metadata=self.token)
+            resp = await client.GetHttpIntegration(req, metadata=self.token)
             return google.protobuf.json_format.MessageToDict(resp)[
                 'integration'
             ]
-        except grpc.RpcError as e:
+        except grpc.aio.AioRpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
                 return None
             raise
 
-    def create_http_integration(
+    async def create_http_integration(
         self: Self, app_id: str, encoding: int, event_endpoint_url: str
     ) -> dict:
         """Create a HTTP application."""
-        client = chirpstack_api.api.ApplicationServiceStub(self.channel)
-        req = chirpstack_api.api.CreateHttpIntegrationRequest()
-        req.integration.application_id = app_id
-        req.integration.encoding = encoding
-        req.integration.event_endpoint_url = event_endpoint_url
-        resp = client.CreateHttpIntegration(req, metadata=self.token)
+        client = self._client()
+        req = chirpstack_api.api.CreateHttpIntegrationRequest(
+            integration=chirpstack_api.api.HttpIntegration(
+                application_id=app_id,
+                encoding=encoding,
+                event_endpoint_url=event_endpoint_url,
+            )
+        )
+        resp = await client.CreateHttpIntegration(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
 
@@ -151,35 +306,62 @@ class _GatewayService:
     """This class provides functions for managing gateways."""
 
     def __init__(
-        self: Self, channel: grpc.Channel, token: list[tuple[str, str]]
+        self: Self,
+        get_channel: Callable[[], grpc.aio.Channel],
+        token: tuple[tuple[str, str], ...],
     ) -> None:
-        """Initialize channel and token properties."""
-        self.channel = channel
+        """Initialize channel accessor and token properties."""
+        self.get_channel = get_channel
         self.token = token
+        self._stub: chirpstack_api.api.GatewayServiceStub | None = None
 
-    def reads(self: Self, offset: int = 0, limit: int = 10) -> dict[str, Any]:
+    def _client(self: Self) -> chirpstack_api.api.GatewayServiceStub:
+        """Get the memoized service stub."""
+        if self._stub is None:
+            self._stub = chirpstack_api.api.GatewayServiceStub(
+                self.get_channel()
+            )
+        return self._stub
+
+    async def reads(
+        self: Self, offset: int = 0, limit: int = 10
+    ) -> dict[str, Any]:
         """Read a sublist of gateways."""
-        client = chirpstack_api.api.GatewayServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.ListGatewaysRequest()
         req.offset = offset
         req.limit = limit
-        resp = client.List(req, metadata=self.token)
-        return google.protobuf.json_format.MessageToDict(resp)
+        resp = await client.List(req, metadata=self.token)
+        return {
+            'totalCount': resp.total_count,
+            'result': [_gateway_item_to_dict(g) for g in resp.result],
+        }
 
-    def read(self: Self, gateway_id: str) -> dict | None:
+    async def read(self: Self, gateway_id: str) -> dict | None:
         """Read a gateway."""
-        client = chirpstack_api.api.GatewayServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.GetGatewayRequest()
         req.gateway_id = gateway_id
         try:
-            resp = client.Get(req, metadata=self.token)
-            return google.protobuf.json_format.MessageToDict(resp)
-        except grpc.RpcError as e:
+            resp = await client.Get(req, metadata=self.token)
+        except grpc.aio.AioRpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
                 return None
             raise
+        g = resp.gateway
+        d = {
+            'gatewayId': g.gateway_id,
+            'name': g.name,
+            'tenantId': g.tenant_id,
+        }
+        if g.description:
+            d['description'] = g.description
+        out = {'gateway': d}
+        if resp.HasField('last_seen_at'):
+            out['lastSeenAt'] = resp.last_seen_at.ToJsonString()
+        return out
 
-    def create(
+    async def create(
         self: Self,
         tenant_id: str,
         gateway_id: str,
@@ -187,36 +369,42 @@ class _GatewayService:
         description: str | None,
     ) -> dict:
         """Create a gateway."""
-        client = chirpstack_api.api.GatewayServiceStub(self.channel)
-        req = chirpstack_api.api.CreateGatewayRequest()
-        req.gateway.gateway_id = gateway_id
-        req.gateway.name = name
+        client = self._client()
+        req = chirpstack_api.api.CreateGatewayRequest(
+            gateway=chirpstack_api.api.Gateway(
+                gateway_id=gateway_id,
+                name=name,
+                tenant_id=tenant_id,
+                stats_interval=3600,
+            )
+        )
         if description is not None:
             req.gateway.description = description
-        req.gateway.tenant_id = tenant_id
-        req.gateway.stats_interval = 3600
-        resp = client.Create(req, metadata=self.token)
+        resp = await client.Create(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
-    def update(
+    async def update(
         self: Self, tenant_id: str, gateway_id: str, name: str, description: str
     ) -> dict:
         """Create a gateway."""
-        client = chirpstack_api.api.GatewayServiceStub(self.channel)
-        req = chirpstack_api.api.UpdateGatewayRequest()
-        req.gateway.gateway_id = gateway_id
-        req.gateway.name = name
-        req.gateway.description = description
-        req.gateway.tenant_id = tenant_id
-        resp = client.Create(req, metadata=self.token)
+        client = self._client()
+        req = chirpstack_api.api.UpdateGatewayRequest(
+            gateway=chirpstack_api.api.Gateway(
+                gateway_id=gateway_id,
+                name=name,
+                description=description,
+                tenant_id=tenant_id,
+            )
+        )
+        resp = await client.Create(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
-    def delete(self: Self, gateway_id: str) -> dict:
+    async def delete(self: Self, gateway_id: str) -> dict:
         """Delete a gateway."""
-        client = chirpstack_api.api.GatewayServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.DeleteGatewayRequest()
         req.gateway_id = gateway_id
-        resp = client.Delete(req, metadata=self.token)
+        resp = await client.Delete(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
 
@@ -224,72 +412,104 @@ class _DeviceService:
     """This class provides functions for managing devices."""
 
     def __init__(
-        self: Self, channel: grpc.Channel, token: list[tuple[str, str]]
+        self: Self,
+        get_channel: Callable[[], grpc.aio.Channel],
+        token: tuple[tuple[str, str], ...],
     ) -> None:
-        """Initialize channel and token properties."""
-        self.channel = channel
+        """Initialize channel accessor and token properties."""
+        self.get_channel = get_channel
         self.token = token
+        self._stub: chirpstack_api.api.DeviceServiceStub | None = None
+
+    def _client(self: Self) -> chirpstack_api.api.DeviceServiceStub:
+        """Get the memoized service stub."""
+        if self._stub is None:
+            self._stub = chirpstack_api.api.DeviceServiceStub(
+                self.get_channel()
+            )
+        return self._stub
 
-    def reads(
+    async def reads(
         self: Self, app_id: str, offset: int = 0, limit: int = 10
     ) -> dict[str, Any]:
         """Read a sublist of devices."""
-        client = chirpstack_api.api.DeviceServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.ListDevicesRequest()
         req.application_id = app_id
         req.offset = offset
         req.limit = limit
-        resp = client.List(req, metadata=self.token)
-        return google.protobuf.json_format.MessageToDict(resp)
+        resp = await client.List(req, metadata=self.token)
+        return {
+            'totalCount': resp.total_count,
+            'result': [_device_item_to_dict(d) for d in resp.result],
+        }
+
+    async def _count(self: Self, app_id: str) -> int:
+        req = chirpstack_api.api.ListDevicesRequest()
+        req.MergeFrom(_COUNT_DEVICES_REQ)
+        req.application_id = app_id
+        resp = await self._client().List(req, metadata=self.token)
+        return resp.total_count
 
-    def count(self: Self, app_id: str) -> int:
+    async def count(self: Self, app_id: str) -> int:
         """Count devices."""
-        r = self.reads(app_id, 0, 1)
-        return r.get('totalCount', 0) if len(r) > 0 else 0
+        return await self._count(app_id)
 
-    def read(self: Self, device_id: str) -> dict | None:
+    async def read(self: Self, device_id: str) -> dict | None:
         """Read a device by ID."""
-        client = chirpstack_api.api.DeviceServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.GetDeviceRequest()
         req.id = device_id
         try:
-            resp = client.Get(req, metadata=self.token)
-            return google.protobuf.json_format.MessageToDict(resp)
-        except grpc.RpcError as e:
+            resp = await client.Get(req, metadata=self.token)
+        except grpc.aio.AioRpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
                 return None
             raise
-
-    def read_by_eui(self: Self, app_id: str, dev_eui: str) -> dict | None:
+        d = resp.device
+        x = {
+            'devEui': d.dev_eui,
+            'name': d.name,
+            'applicationId': d.application_id,
+            'deviceProfileId': d.device_profile_id,
+        }
+        if d.description:
+            x['description'] = d.description
+        return {'device': x}
+
+    async def read_by_eui(self: Self, app_id: str, dev_eui: str) -> dict | None:
         """Read a device by EUI."""
-        client = chirpstack_api.api.DeviceServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.ListDevicesRequest()
         req.offset = 0
         req.limit = 1
         req.search = dev_eui
         req.application_id = app_id
         try:
-            resp = client.List(req, metadata=self.token)
-            return google.protobuf.json_format.MessageToDict(resp)
-        except grpc.RpcError as e:
+            resp = await client.List(req, metadata=self.token)
+        except grpc.aio.AioRpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
                 return None
             raise
+        return {
+            'totalCount': resp.total_count,
+            'result': [_device_item_to_dict(d) for d in resp.result],
+        }
 
-    def delete(self: Self, dev_eui: str) -> dict | None:
+    async def delete(self: Self, dev_eui: str) -> dict | None:
         """Delete a device by EUI."""
-        client = chirpstack_api.api.DeviceServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.DeleteDeviceRequest()
         req.dev_eui = dev_eui
         try:
-            resp = client.Delete(req, metadata=self.token)
+            resp = await client.Delete(req, metadata=self.token)
             return google.protobuf.json_format.MessageToDict(resp)
-        except grpc.RpcError as e:
+        except grpc.aio.AioRpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
                 return None
             raise
 
-    def create(  # noqa: PLR0913
+    async def create(  # noqa: PLR0913
         self: Self,
         name: str,
         description: str,
@@ -298,34 +518,45 @@ class _DeviceService:
         dev_prof_id: str,
     ) -> dict:
         """Create a device."""
-        client = chirpstack_api.api.DeviceServiceStub(self.channel)
-        req = chirpstack_api.api.CreateDeviceRequest()
-        req.device.dev_eui = dev_eui
-        req.device.name = name
-        req.device.description = description
-        req.device.application_id = app_id
-        req.device.device_profile_id = dev_prof_id
-        resp = client.Create(req, metadata=self.token)
+        client = self._client()
+        req = chirpstack_api.api.CreateDeviceRequest(
+            device=chirpstack_api.api.Device(
+                dev_eui=dev_eui,
+                name=name,
+                description=description,
+                application_id=app_id,
+                device_profile_id=dev_prof_id,
+            )
+        )
+        resp = await client.Create(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
-    def read_keys(self: Self, dev_eui: str) -> dict:
+    async def read_keys(self: Self, dev_eui: str) -> dict:
         """Read device keys."""
-        client = chirpstack_api.api.DeviceServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.GetDeviceKeysRequest()
         req.dev_eui = dev_eui
-        resp = client.GetKeys(req, metadata=self.token)
-        return google.protobuf.json_format.MessageToDict(resp)
-
-    def create_keys(
+        resp = await client.GetKeys(req, metadata=self.token)
+        dk = resp.device_keys
+        return {
+            'deviceKeys': {
+                'devEui': dk.dev_eui,
+                'nwkKey': dk.nwk_key,
+                'appKey': dk.app_key,
+            }
+        }
+
+    async def create_keys(
         self: Self, dev_eui: str, nwk_key: str, app_key: str
     ) -> dict:
         """Create device keys."""
-        client = chirpstack_api.api.DeviceServiceStub(self.channel)
-        req = chirpstack_api.api.CreateDeviceKeysRequest()
-        req.device_keys.dev_eui = dev_eui
-        req.device_keys.nwk_key = nwk_key
-        req.device_keys.app_key = app_key
-        resp = client.CreateKeys(req, metadata=self.token)
+        client = self._client()
+        req = chirpstack_api.api.CreateDeviceKeysRequest(
+            device_keys=chirpstack_api.api.DeviceKeys(
+                dev_eui=dev_eui, nwk_key=nwk_key, app_key=app_key
+            )
+        )
+        resp = await client.CreateKeys(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
 
@@ -333,40 +564,63 @@ class _DeviceProfileService:
     """This class represents device profile."""
 
     def __init__(
-        self: Self, channel: grpc.Channel, token: list[tuple[str, str]]
+        self: Self,
+        get_channel: Callable[[], grpc.aio.Channel],
+        token: tuple[tuple[str, str], ...],
     ) -> None:
-        """Initialize channel and token properties."""
-        self.channel = channel
+        """Initialize channel accessor and token properties."""
+        self.get_channel = get_channel
         self.token = token
+        self._stub: chirpstack_api.api.DeviceProfileServiceStub | None = None
 
-    def reads(
+    def _client(self: Self) -> chirpstack_api.api.DeviceProfileServiceStub:
+        """Get the memoized service stub."""
+        if self._stub is None:
+            self._stub = chirpstack_api.api.DeviceProfileServiceStub(
+                self.get_channel()
+            )
+        return self._stub
+
+    async def reads(
         self: Self, tenant_id: str, offset: int = 0, limit: int = 10
     ) -> dict[str, Any]:
         """Read a sublist of device profiles."""
-        client = chirpstack_api.api.DeviceProfileServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.ListDeviceProfilesRequest()
         req.tenant_id = tenant_id
         req.offset = offset
         req.limit = limit
-        resp = client.List(req, metadata=self.token)
-        return google.protobuf.json_format.MessageToDict(resp)
+        resp = await client.List(req, metadata=self.token)
+        return {
+            'totalCount': resp.total_count,
+            'result': [{'id': p.id, 'name': p.name} for p in resp.result],
+        }
 
-    def read(self: Self, device_profile_id: str) -> dict | None:
+    async def read(self: Self, device_profile_id: str) -> dict | None:
         """Read a device profile."""
-        client = chirpstack_api.api.DeviceProfileServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.GetDeviceProfileRequest()
         req.id = device_profile_id
         try:
-            resp = client.Get(req, metadata=self.token)
-            return google.protobuf.json_format.MessageToDict(resp)[
-                'deviceProfile'
-            ]
-        except grpc.RpcError as e:
+            resp = await client.Get(req, metadata=self.token)
+        except grpc.aio.AioRpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
                 return None
             raise
-
-    def create(  # noqa: PLR0913
+        p = resp.device_profile
+        return {
+            'id': p.id,
+            'tenantId': p.tenant_id,
+            'name': p.name,
+            'description': p.description,
+            'adrAlgorithmId': p.adr_algorithm_id,
+            'uplinkInterval': p.uplink_interval,
+            'supportsOtaa': p.supports_otaa,
+            'supportsClassB': p.supports_class_b,
+            'supportsClassC': p.supports_class_c,
+        }
+
+    async def create(  # noqa: PLR0913
         self: Self,
         tenant_id: str,
         name: str,
@@ -377,22 +631,23 @@ class _DeviceProfileService:
         adr_algorithm_id: str,
     ) -> dict:
         """Create a device profile."""
-        client = chirpstack_api.api.DeviceProfileServiceStub(self.channel)
-        req = chirpstack_api.api.CreateDeviceProfileRequest()
-        req.device_profile.name = name
-        req.device_profile.description = name
-        req.device_profile.tenant_id = tenant_id
-        req.device_profile.name = name
-        req.device_profile.description = description
-        req.device_profile.region = region
-        req.device_profile.mac_version = mac_version
-        req.device_profile.reg_params_revision = reg_params_revision
-        req.device_profile.adr_algorithm_id = adr_algorithm_id
-        req.device_profile.supports_otaa = True
-        req.device_profile.supports_class_b = True
-        req.device_profile.supports_class_c = True
-        req.device_profile.uplink_interval = 3600
-        resp = client.Create(req, metadata=self.token)
+        client = self._client()
+        req = chirpstack_api.api.CreateDeviceProfileRequest(
+            device_profile=chirpstack_api.api.DeviceProfile(
+                name=name,
+                description=description,
+                tenant_id=tenant_id,
+                region=region,
+                mac_version=mac_version,
+                reg_params_revision=reg_params_revision,
+                adr_algorithm_id=adr_algorithm_id,
+                supports_otaa=True,
+                supports_class_b=True,
+                supports_class_c=True,
+                uplink_interval=3600,
+            )
+        )
+        resp = await client.Create(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
 
@@ -400,21 +655,34 @@ class _DeviceQueueService:
     """This class represents device queue."""
 
     def __init__(
-        self: Self, channel: grpc.Channel, token: list[tuple[str, str]]
+        self: Self,
+        get_channel: Callable[[], grpc.aio.Channel],
+        token: tuple[tuple[str, str], ...],
     ) -> None:
-        """Initialize channel and token properties."""
-        self.channel = channel
+        """Initialize channel accessor and token properties."""
+        self.get_channel = get_channel
         self.token = token
+        self._stub: chirpstack_api.api.DeviceServiceStub | None = None
+
+    def _client(self: Self) -> chirpstack_api.api.DeviceServiceStub:
+        """Get the memoized service stub."""
+        if self._stub is None:
+            self._stub = chirpstack_api.api.DeviceServiceStub(
+                self.get_channel()
+            )
+        return self._stub
 
-    def enqueue(self: Self, dev_eui: str, data: bytes, f_port: int = 2) -> dict:
+    async def enqueue(
+        self: Self, dev_eui: str, data: bytes, f_port: int = 2
+    ) -> dict:
         """Enqueue a message."""
-        client = chirpstack_api.api.DeviceServiceStub(self.channel)
-        req = chirpstack_api.api.EnqueueDeviceQueueItemRequest()
-        req.queue_item.confirmed = False
-        req.queue_item.dev_eui = dev_eui
-        req.queue_item.data = data
-        req.queue_item.f_port = f_port
-        resp = client.Enqueue(req, metadata=self.token)
+        client = self._client()
+        req = chirpstack_api.api.EnqueueDeviceQueueItemRequest(
+            queue_item=chirpstack_api.api.DeviceQueueItem(
+                confirmed=False, dev_eui=dev_eui, data=data, f_port=f_port
+            )
+        )
+        resp = await client.Enqueue(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
 
@@ -422,126 +690,148 @@ class _MulticastGroupService:
     """This class provides functions for managing multicast groups."""
 
     def __init__(
-        self: Self, channel: grpc.Channel, token: list[tuple[str, str]]
+        self: Self,
+        get_channel: Callable[[], grpc.aio.Channel],
+        token: tuple[tuple[str, str], ...],
     ) -> None:
-        """Initialize channel and token properties."""
-        self.channel = channel
+        """Initialize channel accessor and token properties."""
+        self.get_channel = get_channel
         self.token = token
+        self._stub: chirpstack_api.api.MulticastGroupServiceStub | None = None
+
+    def _client(self: Self) -> chirpstack_api.api.MulticastGroupServiceStub:
+        """Get the memoized service stub."""
+        if self._stub is None:
+            self._stub = chirpstack_api.api.MulticastGroupServiceStub(
+                self.get_channel()
+            )
+        return self._stub
 
-    def read_by_name(self: Self, app_id: str, name: str) -> dict | None:
+    async def read_by_name(self: Self, app_id: str, name: str) -> dict | None:
         """Read a multicast group by name."""
-        client = chirpstack_api.api.MulticastGroupServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.ListMulticastGroupsRequest()
         req.offset = 0
         req.limit = 1
         req.search = name
         req.application_id = app_id
         try:
-            resp = google.protobuf.json_format.MessageToDict(
-                client.List(req, metadata=self.token)
-            )
-            return (
-                resp['result'][0]
-                if (
-                    resp is not None
-                    and resp.get('totalCount', 0) == 1
-                    and len(resp.get('result', [])) > 0
-                )
-                else None
-            )
-        except grpc.RpcError as e:
+            resp = await client.List(req, metadata=self.token)
+        except grpc.aio.AioRpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
                 return None
             raise
+        if resp.total_count != 1 or len(resp.result) == 0:
+            return None
+        mg = resp.result[0]
+        return {'id': mg.id, 'name': mg.name}
 
-    def reads(
+    async def reads(
         self: Self, app_id: str, offset: int = 0, limit: int = 10
     ) -> dict[str, Any]:
         """Read a sublist of multicast groups."""
-        client = chirpstack_api.api.MulticastGroupServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.ListMulticastGroupsRequest()
         req.application_id = app_id
         req.offset = offset
         req.limit = limit
-        resp = client.List(req, metadata=self.token)
-        return google.protobuf.json_format.MessageToDict(resp)
+        resp = await client.List(req, metadata=self.token)
+        return {
+            'totalCount': resp.total_count,
+            'result': [{'id': mg.id, 'name': mg.name} for mg in resp.result],
+        }
+
+    async def _count(self: Self, app_id: str) -> int:
+        req = chirpstack_api.api.ListMulticastGroupsRequest()
+        req.MergeFrom(_COUNT_MULTICAST_GROUPS_REQ)
+        req.application_id = app_id
+        resp = await self._client().List(req, metadata=self.token)
+        return resp.total_count
 
-    def count(self: Self, app_id: str) -> int:
+    async def count(self: Self, app_id: str) -> int:
         """Count multicastGroups."""
-        r = self.reads(app_id, 0, 1)
-        return r.get('totalCount', 0) if len(r) > 0 else 0
+        return await self._count(app_id)
 
-    def read(self: Self, mgid: str) -> dict | None:
+    async def read(self: Self, mgid: str) -> dict | None:
         """Read a multicast group by ID."""
-        client = chirpstack_api.api.MulticastGroupServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.GetMulticastGroupRequest()
         req.id = mgid
         try:
-            resp = google.protobuf.json_format.MessageToDict(
-                client.Get(req, metadata=self.token)
-            )
-            return resp['multicastGroup']
-        except grpc.RpcError as e:
+            resp = await client.Get(req, metadata=self.token)
+        except grpc.aio.AioRpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
                 return None
             raise
-
-    def delete(self: Self, mgid: str) -> dict | None:
+        mg = resp.multicast_group
+        return {
+            'id': mg.id,
+            'name': mg.name,
+            'applicationId': mg.application_id,
+        }
+
+    async def delete(self: Self, mgid: str) -> dict | None:
         """Delete a multicast group by ID."""
-        client = chirpstack_api.api.MulticastGroupServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.DeleteMulticastGroupRequest()
         req.id = mgid
         try:
-            resp = client.Delete(req, metadata=self.token)
+            resp = await client.Delete(req, metadata=self.token)
             return google.protobuf.json_format.MessageToDict(resp)
-        except grpc.RpcError as e:
+        except grpc.aio.AioRpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
                 return None
             raise
 
-    def create(self: Self, app_id: str, name: str) -> dict:
+    async def create(self: Self, app_id: str, name: str) -> dict:
         """Create a multicast group."""
-        client = chirpstack_api.api.MulticastGroupServiceStub(self.channel)
-        req = chirpstack_api.api.CreateMulticastGroupRequest()
-        req.multicast_group.name = name
-        req.multicast_group.application_id = app_id
-        req.multicast_group.region = 2
-        req.multicast_group.mc_addr = '0023f440'
-        req.multicast_group.mc_nwk_s_key = '7396500101ed7ca0247ac8f7b46ab269'
-        req.multicast_group.mc_app_s_key = '3b923538df3fa39443fb4e19502320d5'
-        req.multicast_group.f_cnt = 0
-        req.multicast_group.group_type = 0
-        req.multicast_group.dr = 0
-        req.multicast_group.frequency = 0
-        resp = client.Create(req, metadata=self.token)
+        client = self._client()
+        req = chirpstack_api.api.CreateMulticastGroupRequest(
+            multicast_group=chirpstack_api.api.MulticastGroup(
+                name=name,
+                application_id=app_id,
+                region=2,
+                mc_addr='0023f440',
+                mc_nwk_s_key='7396500101ed7ca0247ac8f7b46ab269',
+                mc_app_s_key='3b923538df3fa39443fb4e19502320d5',
+                f_cnt=0,
+                group_type=0,
+                dr=0,
+                frequency=0,
+            )
+        )
+        resp = await client.Create(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
-    def enqueue(self: Self, mgid: str, data: bytes, f_port: int = 2) -> dict:
+    async def enqueue(
+        self: Self, mgid: str, data: bytes, f_port: int = 2
+    ) -> dict:
         """Enqueue a message to a multicast group."""
-        client = chirpstack_api.api.MulticastGroupServiceStub(self.channel)
-        req = chirpstack_api.api.EnqueueMulticastGroupQueueItemRequest()
-        req.queue_item.multicast_group_id = mgid
-        req.queue_item.data = data
-        req.queue_item.f_port = f_port
-        resp = client.Enqueue(req, metadata=self.token)
+        client = self._client()
+        req = chirpstack_api.api.EnqueueMulticastGroupQueueItemRequest(
+            queue_item=chirpstack_api.api.MulticastGroupQueueItem(
+                multicast_group_id=mgid, data=data, f_port=f_port
+            )
+        )
+        resp = await client.Enqueue(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
-    def add_device(self: Self, mgid: str, dev_eui: str) -> dict:
+    async def add_device(self: Self, mgid: str, dev_eui: str) -> dict:
         """Add a device to a multicast group."""
-        client = chirpstack_api.api.MulticastGroupServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.AddDeviceToMulticastGroupRequest()
         req.multicast_group_id = mgid
         req.dev_eui = dev_eui
-        resp = client.AddDevice(req, metadata=self.token)
+        resp = await client.AddDevice(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
-    def remove_device(self: Self, mgid: str, dev_eui: str) -> dict:
+    async def remove_device(self: Self, mgid: str, dev_eui: str) -> dict:
         """Add a device to a multicast group."""
-        client = chirpstack_api.api.MulticastGroupServiceStub(self.channel)
+        client = self._client()
         req = chirpstack_api.api.RemoveDeviceFromMulticastGroupRequest()
         req.multicast_group_id = mgid
         req.dev_eui = dev_eui
-        resp = client.RemoveDevice(req, metadata=self.token)
+        resp = await client.RemoveDevice(req, metadata=self.token)
         return google.protobuf.json_format.MessageToDict(resp)
 
 
@@ -564,50 +854,96 @@ class _ChirpStackService:
         ],
     ) -> None:
         """Initialize all ChirpStack related subservices."""
-        channel = grpc.insecure_channel(settings.CHIRPSTACK_SERVER_URL)
-        token = [
-            ('authorization', f'Bearer {settings.CHIRPSTACK_SERVER_JWT_TOKEN}')
-        ]
-
-        self.settings = settings
-        self.tenant = _TenantService(channel, token)
-        self.application = _ApplicationService(channel, token)
-        self.gateway = _GatewayService(channel, token)
-        self.device = _DeviceService(channel, token)
-        self.device_queue = _DeviceQueueService(channel, token)
-        self.device_profile = _DeviceProfileService(channel, token)
-        self.multicast_group = _MulticastGroupService(channel, token)
-
-    def get_current_state(self: Self) -> ChirpStackState:
-        """Determine if ChirpStack is ready."""
-        channel = grpc.insecure_channel(self.settings.CHIRPSTACK_SERVER_URL)
-        token = [
+        token = (
             (
                 'authorization',
-                f'Bearer {self.settings.CHIRPSTACK_SERVER_JWT_TOKEN}',
+                f'Bearer {settings.CHIRPSTACK_SERVER_JWT_TOKEN}',
+            ),
+        )
+
+        self.settings = settings
+        self._channels: list[grpc.aio.Channel | None] = (
+            [None] * _CHANNEL_POOL_SIZE
+        )
+        pool = itertools.cycle(range(_CHANNEL_POOL_SIZE))
+        self.tenant = _TenantService(self._channel_getter(next(pool)), token)
+        self.application = _ApplicationService(
+            self._channel_getter(next(pool)), token
+        )
+        self.gateway = _GatewayService(self._channel_getter(next(pool)), token)
+        self.device = _DeviceService(self._channel_getter(next(pool)), token)
+        self.device_queue = _DeviceQueueService(
+            self._channel_getter(next(pool)), token
+        )
+        self.device_profile = _DeviceProfileService(
+            self._channel_getter(next(pool)), token
+        )
+        self.multicast_group = _MulticastGroupService(
+            self._channel_getter(next(pool)), token
+        )
+        self._state = ChirpStackState.UNKNOWN
+        self._state_expire = 0.0
+
+    def _channel_getter(
+        self: Self, i: int
+    ) -> Callable[[], grpc.aio.Channel]:
+        """Bind pool slot i to a channel accessor."""
+        return functools.partial(self._get_channel, i)
+
+    def _get_channel(self: Self, i: int) -> grpc.aio.Channel:
+        """Create pool channel i inside the running event loop."""
+        if self._channels[i] is None:
+            self._channels[i] = grpc.aio.insecure_channel(
+                self.settings.CHIRPSTACK_SERVER_URL,
+                options=[('grpc.use_local_subchannel_pool', 1)],
             )
-        ]
-        tenant = _TenantService(channel, token)
+        return self._channels[i]
+
+    async def get_current_state(self: Self) -> ChirpStackState:
+        """Determine if ChirpStack is ready."""
+        if time.monotonic() < self._state_expire:
+            return self._state
+        client = self.tenant._client()  # noqa: SLF001
         try:
-            tenant.reads()
-        except grpc.RpcError as e:
+            await client.List(_PROBE_TENANTS_REQ, metadata=self.tenant.token)
+        except grpc.aio.AioRpcError as e:
             match e.code():
                 case grpc.StatusCode.UNAUTHENTICATED:
-                    return ChirpStackState.UNAUTHENTICATED
+                    state = ChirpStackState.UNAUTHENTICATED
                 case grpc.StatusCode.UNAVAILABLE:
-                    return ChirpStackState.UNAVAILABLE
+                    state = ChirpStackState.UNAVAILABLE
                 case _:
-                    return ChirpStackState.UNKNOWN
+                    state = ChirpStackState.UNKNOWN
         else:
-            return ChirpStackState.READY
+            state = ChirpStackState.READY
+        self._state = state
+        self._state_expire = time.monotonic() + _STATE_TTL_SECONDS
+        return state
+
+    async def bulk_count(self: Self, app_ids: Sequence[str]) -> list[int]:
+        """Count devices across applications concurrently."""
+        return list(
+            await asyncio.gather(*(self.device.count(a) for a in app_ids))
+        )
 
 
 _chirpstack_serv = _ChirpStackService(api.config.get_settings())
 
 OAUTH2_SCHEME = fastapi.security.OAuth2PasswordBearer(tokenUrl='api/token')
-_pwd_context = passlib.context.CryptContext(
-    schemes=['bcrypt'], deprecated='auto'
-)
+
+_JWT_KEY = api.config.get_settings().NL_API_SECRET_KEY.encode()
+_JWT_ALGORITHM = api.config.get_settings().NL_API_ALGORITHM
+_JWT_DECODE_OPTIONS = {'verify_signature': True, 'require': ['exp', 'sub']}
+
+
+def _hash_password(password: str) -> str:
+    """Hash a password with bcrypt."""
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=12)).decode()
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its bcrypt hash."""
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
 class AuthService:
@@ -631,19 +967,19 @@ class AuthService:
         self: Self, plain_password: str, hashed_password: str
     ) -> bool:
         """Verify password."""
-        return _pwd_context.verify(plain_password, hashed_password)
+        return _verify_password(plain_password, hashed_password)
 
     def get_password_hash(self: Self, password: str) -> str:
         """Get password hash."""
-        return _pwd_context.hash(password)
+        return _hash_password(password)
 
     async def authenticate(
         self: Self, email: str, password: str
     ) -> api.models.User | None:
         """Return user if pass otherwise false."""
         user = await self.user_repo.find_by_email(email)
-        if user is not None and _pwd_context.verify(
-            password, user.hashed_password
+        if user is not None and await asyncio.to_thread(
+            _verify_password, password, user.hashed_password
         ):
             return user
         return None
@@ -662,11 +998,7 @@ class AuthService:
                 tz=datetime.timezone.utc
             ) + datetime.timedelta(minutes=15)
         to_encode.update({'exp': expire})
-        return jose.jwt.encode(
-            to_encode,
-            self.settings.NL_API_SECRET_KEY,
-            algorithm=self.settings.NL_API_ALGORITHM,
-        )
+        return jwt.encode(to_encode, _JWT_KEY, algorithm=_JWT_ALGORITHM)
 
     @staticmethod
     async def get_current_user(
@@ -686,15 +1018,16 @@ class AuthService:
             headers={'WWW-Authenticate': 'Bearer'},
         )
         try:
-            payload = jose.jwt.decode(
+            payload = jwt.decode(
                 token,
-                settings.NL_API_SECRET_KEY,
-                algorithms=[settings.NL_API_ALGORITHM],
+                _JWT_KEY,
+                algorithms=[_JWT_ALGORITHM],
+                options=_JWT_DECODE_OPTIONS,
             )
             username = payload.get('sub')
             if username is None:
                 raise credentials_exception
-        except jose.JWTError:
+        except jwt.PyJWTError:
             raise credentials_exception  # noqa: B904
         user = await user_repo.find_by_email(username)
         if user is None:
@@ -720,7 +1053,9 @@ class UserService:
         u = api.models.User(
             account_id=uc.account_id,
             email=uc.email,
-            hashed_password=_pwd_context.hash(uc.password),
+            hashed_password=await asyncio.to_thread(
+                _hash_password, uc.password
+            ),
             first_name=uc.first_name,
             last_name=uc.last_name,
             role=uc.role,
@@ -752,7 +1087,9 @@ class UserService:
         def to_schema_user(
             us: Sequence[api.models.User],
         ) -> Sequence[api.schemas.User]:
-            return [api.schemas.User.from_orm(u) for u in us]
+            return _USER_LIST_ADAPTER.validate_python(
+                us, from_attributes=True
+            )
 
         match current_user.role:
             case 'super-admin':
@@ -769,6 +1106,147 @@ class UserService:
                 return [current_user]
 
 
+_DIMMER_PROTOCOL_CONFIG = {
+    'sync_request_timeout': 30,
+    'include_local_traceback': False,
+    'include_local_version': False,
+}
+
+
+@dataclasses.dataclass
+class _DimmerConn:
+    """This class holds a dimmer connection and cached method netrefs."""
+
+    conn: rpyc.Connection
+    add_job: Callable
+    add_jobs: Callable
+    remove_job: Callable
+
+
+class _DimmerConnPool:
+    """This class provides a pool of connections to the dimmer daemon."""
+
+    def __init__(self: Self, host: str, port: int, size: int = 4) -> None:
+        """Initialize host, port, and the idle-connection queue."""
+        self.host = host
+        self.port = port
+        self._idle: queue.Queue[_DimmerConn] = queue.Queue(maxsize=size)
+
+    def _connect(self: Self) -> _DimmerConn:
+        # Cache the method netrefs once so each call skips the attribute
+        # round-trips rpyc performs on every conn.root access.
+        conn = rpyc.connect(
+            self.host, self.port, config=_DIMMER_PROTOCOL_CONFIG
+        )
+        return _DimmerConn(
+            conn=conn,
+            add_job=conn.root.add_job,
+            add_jobs=conn.root.add_jobs,
+            remove_job=conn.root.remove_job,
+        )
+
+    @contextlib.contextmanager
+    def acquire(self: Self):  # noqa: ANN202
+        """Check a healthy connection out of the pool."""
+        try:
+            dc = self._idle.get_nowait()
+        except queue.Empty:
+            dc = self._connect()
+        else:
+            try:
+                dc.conn.ping()
+            except (EOFError, OSError):
+                dc.conn.close()
+                dc = self._connect()
+        try:
+            yield dc
+        except (EOFError, OSError):
+            dc.conn.close()
+            raise
+        else:
+            with contextlib.suppress(queue.Full):
+                self._idle.put_nowait(dc)
+
+    def close(self: Self) -> None:
+        """Close all idle connections."""
+        with contextlib.suppress(queue.Empty):
+            while True:
+                self._idle.get_nowait().conn.close()
+
+
+class _DimmerService:
+    """This class provides pooled access to the dimmer daemon."""
+
+    def __init__(self: Self, host: str, port: int, size: int = 4) -> None:
+        """Initialize the connection pool."""
+        self.pool = _DimmerConnPool(host, port, size)
+
+    def _add_job(self: Self, *args: Any, **kwargs: Any):  # noqa: ANN202
+        with self.pool.acquire() as dc:
+            return dc.add_job(*args, **kwargs)
+
+    def _add_jobs(self: Self, specs: list[dict[str, Any]]) -> list[str]:
+        with self.pool.acquire() as dc:
+            return list(dc.add_jobs(specs))
+
+    def _remove_job(self: Self, job_id: str) -> None:
+        with self.pool.acquire() as dc:
+            dc.remove_job(job_id)
+
+    def _remove_jobs(self: Self, job_ids: Sequence[str]) -> None:
+        with self.pool.acquire() as dc:
+            remove = rpyc.async_(dc.remove_job)
+            for future in [remove(job_id) for job_id in job_ids]:
+                future.wait()
+
+    async def add_job(self: Self, *args: Any, **kwargs: Any):  # noqa: ANN201
+        """Add a job on the dimmer scheduler."""
+        return await asyncio.to_thread(self._add_job, *args, **kwargs)
+
+    async def add_jobs(self: Self, specs: list[dict[str, Any]]) -> list[str]:
+        """Add many jobs on the dimmer scheduler in one round-trip."""
+        return await asyncio.to_thread(self._add_jobs, specs)
+
+    async def remove_job(self: Self, job_id: str) -> None:
+        """Remove a job from the dimmer scheduler."""
+        await asyncio.to_thread(self._remove_job, job_id)
+
+    async def remove_jobs(self: Self, job_ids: Sequence[str]) -> None:
+        """Remove many jobs, pipelined on a single connection."""
+        if not job_ids:
+            return
+        await asyncio.to_thread(self._remove_jobs, job_ids)
+
+    def close(self: Self) -> None:
+        """Close the pooled connections."""
+        self.pool.close()
+
+
+@functools.lru_cache
+def _get_dimmer_serv(host: str, port: int) -> _DimmerService:
+    """Get the shared dimmer service for a host and port."""
+    settings = api.config.get_settings()
+    return _DimmerService(host, port, settings.NL_DIMMER_POOL_SIZE)
+
+
+def _dimming_event_from_create(
+    dec: api.schemas.DimmingEventCreate, job_id: str
+) -> api.models.DimmingEvent:
+    """Build a dimming event model from a create schema and job ID."""
+    return api.models.DimmingEvent(
+        account_id=dec.account_id,
+        dimming_profile_id=dec.dimming_profile_id,
+        target_id=dec.target_id,
+        target_type=dec.target_type,
+        job_id=job_id,
+        command=dec.command,
+        start=dec.start,
+        end=dec.end,
+        color=dec.color,
+        text_color=dec.text_color,
+    )
+
+
 class DimmingEventService:
     """This class provides functions for managing dimming events."""
 
@@ -782,10 +1260,11 @@ class DimmingEventService:
             fastapi.Depends(api.repositories.DimmingEventRepository),
         ],
     ) -> None:
-        """Initialize repo, dimmer_host, and dimmer_port properties."""
+        """Initialize repo and dimmer_serv properties."""
         self.repo = repo
-        self.dimmer_host = settings.NL_DIMMER_HOST
-        self.dimmer_port = settings.NL_DIMMER_PORT
+        self.dimmer_serv = _get_dimmer_serv(
+            settings.NL_DIMMER_HOST, settings.NL_DIMMER_PORT
+        )
 
     async def get_one(self: Self, deid: int) -> api.schemas.DimmingEvent | None:
         """Get a dimming event by ID."""
@@ -799,32 +1278,26 @@ class DimmingEventService:
         """Get a sublist of dimming events."""
         return api.schemas.DimmingEventList(
             total=await self.repo.count(),
-            data=[
-                api.schemas.DimmingEvent.from_orm(x)
-                for x in await self.repo.find_all(skip, limit)
-            ],
+            data=_DIMMING_EVENT_LIST_ADAPTER.validate_python(
+                await self.repo.find_all(skip, limit), from_attributes=True
+            ),
         )
 
     async def create(
         self: Self, dec: api.schemas.DimmingEventCreate
     ) -> int | None:
         """Create a dimming event."""
-        cmd = dec.command.value
-        if cmd.startswith('dim'):
-            val = int(cmd.split('_')[1])
-            args = [dec.target_id, val]
-        else:
-            args = [dec.target_id]
+        cmd_str, _, val = _DIMMING_DISPATCH[dec.command]
+        args = [dec.target_id] if val is None else [dec.target_id, val]
 
-        conn = rpyc.connect(self.dimmer_host, self.dimmer_port)
-        job = conn.root.add_job(
-            f'dimmer:commands.{cmd}',
+        job = await self.dimmer_serv.add_job(
+            cmd_str,
             'cron',
             args=args,
             hour=dec.start.time().hour,
             minute=dec.start.time().minute,
         )
-        de = api.models.DimmingEvent(**(dec.model_dump() | {'job_id': job.id}))
+        de = _dimming_event_from_create(dec, job.id)
 
         return await self.repo.insert(de)
 
@@ -837,45 +1310,27 @@ class DimmingEventService:
         de = await self.repo.find_by_id(deid)
         if de is None:
             return 0
-        conn = rpyc.connect(self.dimmer_host, self.dimmer_port)
-        conn.root.remove_job(de.job_id)
+        await self.dimmer_serv.remove_job(de.job_id)
 
-        cmd = deu.command.value
-        if cmd.startswith('dim'):
-            val = int(cmd.split('_')[1])
-            args = [deu.target_id, val]
-        else:
-            args = [deu.target_id]
+        cmd_str, _, val = _DIMMING_DISPATCH[deu.command]
+        args = [deu.target_id] if val is None else [deu.target_id, val]
 
-        job = conn.root.add_job(
-            f'dimmer:commands.{cmd}',
+        job = await self.dimmer_serv.add_job(
+            cmd_str,
             'cron',
             args=args,
             hour=deu.start.time().hour,
             minute=deu.start.time().minute,
         )
 
-        ude = api.models.DimmingEvent(
-            id=de.id,
-            account_id=de.account_id,
-            job_id=job.id,
-            target_id=de.target_id,
-            command=de.command,
-            start=de.start,
-            end=de.end,
-            color=de.color,
-            text_color=de.text_color,
-        )
-
-        return await self.repo.update(ude)
+        return await self.repo.update_job_id(de.id, job.id)
 
     async def delete_by_id(self: Self, deid: int) -> int:
         """Delete dimming event by ID."""
         de = await self.repo.find_by_id(deid)
         if de is None:
             return 0
-        conn = rpyc.connect(self.dimmer_host, self.dimmer_port)
-        conn.root.remove_job(de.job_id)
+        await self.dimmer_serv.remove_job(de.job_id)
         return await self.repo.delete_by_id(deid)
 
 
@@ -899,35 +1354,15 @@ class DimmingProfileService:
         """Initialize the repo property."""
         self.dprof_repo = dprof_repo
         self.devent_repo = de_repo
-        self.dimmer_host = settings.NL_DIMMER_HOST
-        self.dimmer_port = settings.NL_DIMMER_PORT
-
-    async def _add_command_job(  # noqa: ANN202
-        self: Self,
-        cmd: api.models.DimmingCommand,
-        date: datetime.datetime,
-        target_id: str,
-    ):
-        if cmd.value.startswith('dim'):
-            val = int(cmd.value.split('_')[1])
-            cmd_str = 'dimmer:commands.dim_group'
-            args = [target_id, val]
-        else:
-            cmd_str = f'dimmer:commands.{cmd.value}_group'
-            args = [target_id]
-
-        conn = rpyc.connect(self.dimmer_host, self.dimmer_port)
-        return conn.root.add_job(
-            cmd_str,
-            'cron',
-            args=args,
-            hour=date.time().hour,
-            minute=date.time().minute,
+        self.dimmer_serv = _get_dimmer_serv(
+            settings.NL_DIMMER_HOST, settings.NL_DIMMER_PORT
         )
 
     async def _create_events(
         self: Self, dpid: int, dpc: api.schemas.DimmingProfileBase
     ) -> None:
+        specs = []
+        decs = []
         for hour, cmd in [
             (18, dpc.sunset_dim_cmd0),
             (18, dpc.sunset_dim_cmd1),
@@ -940,22 +1375,39 @@ class DimmingProfileService:
             (6, dpc.sunrise_dim_cmd1),
         ]:
             date = api.utils.today_hour(hour)
-            dec = api.schemas.DimmingEventCreate(
-                account_id=dpc.account_id,
-                dimming_profile_id=dpid,
-                target_id=dpc.multicast_group_id,
-                target_type=api.models.TargetType.DEVICE_GROUP,
-                command=cmd,
-                start=date,
-                end=date,
-                color=dpc.color,
-                text_color='#ffffff',
+            _, cmd_str, val = _DIMMING_DISPATCH[cmd]
+            args = (
+                [dpc.multicast_group_id]
+                if val is None
+                else [dpc.multicast_group_id, val]
             )
-            job = await self._add_command_job(cmd, date, dpc.multicast_group_id)
-            de = api.models.DimmingEvent(
-                **(dec.model_dump() | {'job_id': job.id})
+            specs.append(
+                {
+                    'cmd': cmd_str,
+                    'args': args,
+                    'hour': date.time().hour,
+                    'minute': date.time().minute,
+                }
+            )
+            decs.append(
+                api.schemas.DimmingEventCreate(
+                    account_id=dpc.account_id,
+                    dimming_profile_id=dpid,
+                    target_id=dpc.multicast_group_id,
+                    target_type=api.models.TargetType.DEVICE_GROUP,
+                    command=cmd,
+                    start=date,
+                    end=date,
+                    color=dpc.color,
+                    text_color='#ffffff',
+                )
             )
-            await self.devent_repo.insert(de)
+        job_ids = await self.dimmer_serv.add_jobs(specs)
+        des = [
+            _dimming_event_from_create(dec, job_id)
+            for dec, job_id in zip(decs, job_ids, strict=True)
+        ]
+        await self.devent_repo.insert_many(des)
 
     async def create(
         self: Self, dpc: api.schemas.DimmingProfileCreate
@@ -1004,9 +1456,10 @@ class DimmingProfileService:
             dp.sunrise_dim_cmd0 = dpu.sunrise_dim_cmd0
             dp.sunrise_dim_cmd1 = dpu.sunrise_dim_cmd1
             if await self.dprof_repo.update(dpid, dp):
-                conn = rpyc.connect(self.dimmer_host, self.dimmer_port)
-                for de in await self.devent_repo.find_by_pid(dpid):
-                    conn.root.remove_job(de.job_id)
+                des = await self.devent_repo.find_by_pid(dpid)
+                await self.dimmer_serv.remove_jobs(
+                    [de.job_id for de in des]
+                )
                 await self.devent_repo.delete_by_dpid(dpid)
                 await self._create_events(dpid, dpu)
         return None
@@ -1026,16 +1479,15 @@ class DimmingProfileService:
         return api.schemas.DimmingProfileList(
             total=await self.dprof_repo.count(),
             data=[
-                api.schemas.DimmingProfile.from_orm(dp)
-                for dp in await self.dprof_repo.find_all(skip, limit)
+                api.schemas.DimmingProfile.model_construct(**r)
+                for r in await self.dprof_repo.find_all_rows(skip, limit)
             ],
         )
 
     async def delete_one(self: Self, dpid: int) -> int:
         """Delete dimming profile by ID."""
-        conn = rpyc.connect(self.dimmer_host, self.dimmer_port)
-        for de in await self.devent_repo.find_by_pid(dpid):
-            conn.root.remove_job(de.job_id)
+        des = await self.devent_repo.find_by_pid(dpid)
+        await self.dimmer_serv.remove_jobs([de.job_id for de in des])
         await self.devent_repo.delete_by_dpid(dpid)
         return await self.dprof_repo.delete_by_id(dpid)
 
@@ -1047,29 +1499,35 @@ class GatewayService:
         """Initialize classes properties."""
         self.chirpstack_serv = _chirpstack_serv
 
-    def reads(self: Self, offset: int = 0, limit: int = 10) -> dict[str, Any]:
+    async def reads(
+        self: Self, offset: int = 0, limit: int = 10
+    ) -> dict[str, Any]:
         """Read a sublist of gateways."""
-        return self.chirpstack_serv.gateway.reads(offset, limit)
+        return await self.chirpstack_serv.gateway.reads(offset, limit)
 
-    def read(self: Self, gid: str) -> dict | None:
+    async def read(self: Self, gid: str) -> dict | None:
         """Read a gateway."""
-        return self.chirpstack_serv.gateway.read(gid)
+        return await self.chirpstack_serv.gateway.read(gid)
 
-    def create(
+    async def create(
         self: Self, tid: str, gid: str, name: str, description: str | None
     ) -> dict:
         """Create a gateway."""
-        return self.chirpstack_serv.gateway.create(tid, gid, name, description)
+        return await self.chirpstack_serv.gateway.create(
+            tid, gid, name, description
+        )
 
-    def update(
+    async def update(
         self: Self, tid: str, gid: str, name: str, description: str
     ) -> dict:
         """Update a gateway."""
-        return self.chirpstack_serv.gateway.update(tid, gid, name, description)
+        return await self.chirpstack_serv.gateway.update(
+            tid, gid, name, description
+        )
 
-    def delete(self: Self, gid: str) -> dict:
+    async def delete(self: Self, gid: str) -> dict:
         """Delete a gateway."""
-        return self.chirpstack_serv.gateway.delete(gid)
+        return await self.chirpstack_serv.gateway.delete(gid)
 
 
 class StreetlampService:
@@ -1092,8 +1550,8 @@ class StreetlampService:
         """Get a sublist of devices."""
         return api.schemas.StreetlampList(
             data=[
-                api.schemas.Streetlamp.from_orm(s)
-                for s in await self.streetlamp_repo.find_all(skip, limit)
+                api.schemas.Streetlamp.model_construct(**r)
+                for r in await self.streetlamp_repo.find_all_rows(skip, limit)
             ],
             total=await self.streetlamp_repo.count(),
         )
@@ -1101,7 +1559,7 @@ class StreetlampService:
     async def _create_or_read_device(
         self: Self, name: str, app_id: str, dev_eui: str, dev_prof_id: str
     ) -> str:
-        r = self.chirpstack_serv.device.read_by_eui(app_id, dev_eui)
+        r = await self.chirpstack_serv.device.read_by_eui(app_id, dev_eui)
         if (
             r is not None
             and 'totalCount' in r
@@ -1109,7 +1567,7 @@ class StreetlampService:
             and len(r['result']) > 0
         ):
             return dev_eui
-        r = self.chirpstack_serv.device.create(
+        r = await self.chirpstack_serv.device.create(
             name=name,
             description='',
             app_id=app_id,
@@ -1121,10 +1579,27 @@ class StreetlampService:
     async def _create_device_keys(
         self: Self, dev_eui: str, app_key: str
     ) -> None:
-        self.chirpstack_serv.device.create_keys(
-            dev_eui=dev_eui, nwk_key=app_key, app_key=app_key
+        key = bytes.fromhex(app_key).hex()
+        await self.chirpstack_serv.device.create_keys(
+            dev_eui=dev_eui, nwk_key=key, app_key=key
         )
 
+    async def _provision_device(
+        self: Self,
+        sc: api.schemas.StreetlampCreate,
+        cs_app_id: str,
+        dev_prof_id: str,
+    ) -> api.models.Streetlamp:
+        eui = sc.device_eui.lower()
+        await self._create_or_read_device(
+            name=sc.name,
+            app_id=cs_app_id,
+            dev_eui=eui,
+            dev_prof_id=dev_prof_id,
+        )
+        await self._create_device_keys(dev_eui=eui, app_key=sc.app_key)
+        return api.models.Streetlamp(**sc.model_dump(exclude={'app_key': True}))
+
     async def create(
         self: Self,
         sc: api.schemas.StreetlampCreate,
@@ -1132,22 +1607,13 @@ class StreetlampService:
         cs_streetlamp_dp_id: str,
     ) -> int | None:
         """Create streetlamp."""
-        dp = self.chirpstack_serv.device_profile.read(cs_streetlamp_dp_id)
-        if dp is not None:
-            await self._create_or_read_device(
-                name=sc.name,
-                app_id=cs_app_id,
-                dev_eui=sc.device_eui.lower(),
-                dev_prof_id=dp['id'],
-            )
-            await self._create_device_keys(
-                dev_eui=sc.device_eui.lower(), app_key=sc.app_key
-            )
-            s = api.models.Streetlamp(
-                **sc.model_dump(exclude={'app_key': True})
-            )
-            return await self.streetlamp_repo.insert(s)
-        return None
+        dp = await self.chirpstack_serv.device_profile.read(
+            cs_streetlamp_dp_id
+        )
+        if dp is None:
+            return None
+        s = await self._provision_device(sc, cs_app_id, dp['id'])
+        return await self.streetlamp_repo.insert(s)
 
     async def creates(
         self: Self,
@@ -1157,27 +1623,53 @@ class StreetlampService:
         cs_streetlamp_dp_id: str,
     ) -> list[dict]:
         """Create streetlamps from file."""
-        s = await file.read()
-        es = []
-        for x in csv.DictReader(io.StringIO(s.decode('utf-8'))):
+        dp = await self.chirpstack_serv.device_profile.read(
+            cs_streetlamp_dp_id
+        )
+        if dp is None:
+            return [{'loc': 'name', 'msg': 'device profile not found'}]
+        es: list[dict] = []
+        reader = csv.DictReader(io.TextIOWrapper(file.file, encoding='utf-8'))
+        while chunk := list(itertools.islice(reader, _CREATES_CHUNK_SIZE)):
+            scs = []
+            for x in chunk:
+                name_lower = x['name'].lower()
+                scs.append(
+                    api.schemas.StreetlampCreate(
+                        account_id=aid,
+                        device_eui=name_lower,
+                        name='NLPY' + name_lower,
+                        app_key=x['app_key'],
+                        lon=float(x['lon']),
+                        lat=float(x['lat']),
+                    )
+                )
+            results = await asyncio.gather(
+                *(
+                    self._provision_device(sc, cs_app_id, dp['id'])
+                    for sc in scs
+                ),
+                return_exceptions=True,
+            )
+            ok = []
+            for r in results:
+                if isinstance(r, grpc.aio.AioRpcError):
+                    es.append({'loc': 'name', 'msg': str(r)})
+                elif isinstance(r, BaseException):
+                    raise r
+                elif r is not None:
+                    ok.append(r)
             try:
                 async with self.streetlamp_repo.db.begin_nested():
-                    await self.create(
-                        sc=api.schemas.StreetlampCreate(
-                            account_id=aid,
-                            device_eui=x['name'].lower(),
-                            name='NLPY' + x['name'].lower(),
-                            app_key=x['app_key'],
-                            lon=float(x['lon']),
-                            lat=float(x['lat']),
-                        ),
-                        cs_app_id=cs_app_id,
-                        cs_streetlamp_dp_id=cs_streetlamp_dp_id,
-                    )
-            except sqlalchemy.exc.IntegrityError as e:  # noqa: PERF203
-                es.append({'loc': 'name', 'msg': str(e)})
-            except grpc.RpcError as e:
-                es.append({'loc': 'name', 'msg': str(e)})
+                    await self.streetlamp_repo.insert_many(ok)
+            except sqlalchemy.exc.IntegrityError:
+                # Retry one by one so only the conflicting rows are lost.
+                for s in ok:
+                    try:
+                        async with self.streetlamp_repo.db.begin_nested():
+                            await self.streetlamp_repo.insert(s)
+                    except sqlalchemy.exc.IntegrityError as e:  # noqa: PERF203
+                        es.append({'loc': 'name', 'msg': str(e)})
         return es
 
     async def update(
@@ -1201,7 +1693,9 @@ class StreetlampService:
         """Delete a streetlamp."""
         if (
             s := await self.streetlamp_repo.find_by_id(sid)
-        ) and self.chirpstack_serv.device.delete(s.device_eui) is not None:
+        ) and (
+            await self.chirpstack_serv.device.delete(s.device_eui)
+        ) is not None:
             return await self.streetlamp_repo.delete_by_id(sid)
         return False
 
@@ -1224,34 +1718,51 @@ class StreetlampDeviceService:
         self: Self, cs_application_id: str, skip: int, limit: int
     ) -> dict:
         """Get a sublist of devices."""
-        return self.chirpstack_serv.device.reads(cs_application_id, skip, limit)
+        return await self.chirpstack_serv.device.reads(
+            cs_application_id, skip, limit
+        )
 
     async def get_available(self: Self, cs_application_id: str) -> list[str]:
         """Get the EUI of the available streetlamps."""
-        dc = self.chirpstack_serv.device.count(cs_application_id)
-        dr = self.chirpstack_serv.device.reads(cs_application_id, 0, dc)
-        dev_euis = [d['devEui'] for d in dr['result']]
-        sc = await self.streetlamp_repo.count()
-        if sc is not None:
-            ss = await self.streetlamp_repo.find_all(limit=sc)
-            return list(filter(lambda x: x not in ss, dev_euis))
-        return []
-
-    def enqueue_command(self: Self, dev_eui: str, cmd: bytes) -> dict:
+        dc, ss = await asyncio.gather(
+            self.chirpstack_serv.device.count(cs_application_id),
+            self.streetlamp_repo.find_all(),
+        )
+        pages = await asyncio.gather(
+            *(
+                self.chirpstack_serv.device.reads(
+                    cs_application_id, off, _READS_PAGE_SIZE
+                )
+                for off in range(0, dc, _READS_PAGE_SIZE)
+            )
+        )
+        taken = {s.device_eui for s in ss}
+        return [
+            d['devEui']
+            for page in pages
+            for d in page['result']
+            if d['devEui'] not in taken
+        ]
+
+    async def enqueue_command(self: Self, dev_eui: str, cmd: bytes) -> dict:
         """Turn on a FMC device."""
-        return self.chirpstack_serv.device_queue.enqueue(dev_eui, cmd)
+        return await self.chirpstack_serv.device_queue.enqueue(dev_eui, cmd)
 
-    def turn_on(self: Self, dev_eui: str) -> dict:
+    async def turn_on(self: Self, dev_eui: str) -> dict:
         """Turn on a FMC device."""
-        return self.chirpstack_serv.device_queue.enqueue(dev_eui, b'9529-ON')
+        return await self.chirpstack_serv.device_queue.enqueue(
+            dev_eui, b'9529-ON'
+        )
 
-    def turn_off(self: Self, dev_eui: str) -> dict:
+    async def turn_off(self: Self, dev_eui: str) -> dict:
         """Turn off a FMC device."""
-        return self.chirpstack_serv.device_queue.enqueue(dev_eui, b'9529-OF')
+        return await self.chirpstack_serv.device_queue.enqueue(
+            dev_eui, b'9529-OF'
+        )
 
-    def dim(self: Self, dev_eui: str, val: int) -> dict:
+    async def dim(self: Self, dev_eui: str, val: int) -> dict:
         """Dim a FMC device."""
-        return self.chirpstack_serv.device_queue.enqueue(
+        return await self.chirpstack_serv.device_queue.enqueue(
             dev_eui, bytes(f'9529-DM{str(val).zfill(3)}', 'utf-8')
         )
 
@@ -1259,45 +1770,170 @@ class StreetlampDeviceService:
 STREETLAMP_STATES_STR = 'streetlamp_states'
 
 
+_STATE_STRUCT = struct.Struct('<cdcdcdcdcdcdc?8s')
+_STATE_STRUCT_SKIP = struct.Struct('<xdxdxdxdxdxdx?8x')
+_STATE_STRUCT_RAW = struct.Struct('<6d?')
+
+_MIN_VALID_VALUE = 0.0001
+_MAX_VALID_VALUE = 1000.0
+
+_CREATES_CHUNK_SIZE = 100
+
+_READS_PAGE_SIZE = 1000
+
+_LAST_STATE_KEY = 'nl:last_state:{}'
+
+
+def _values_valid(*vals: float) -> bool:
+    """Check that every value is finite and within the valid range."""
+    # A NaN fails the chained comparison, so no explicit isnan is needed.
+    return all(_MIN_VALID_VALUE <= v <= _MAX_VALID_VALUE for v in vals)
+
+
 def encode_state_data(sds: api.schemas.StreetlampDeviceState) -> str:
     """Encode FMC device state data."""
+    return base64.b64encode(
+        _STATE_STRUCT.pack(
+            b'V',
+            sds.voltage,
+            b'I',
+            sds.current,
+            b'M',
+            sds.energy_out,
+            b'E',
+            sds.energy_in,
+            b'W',
+            sds.power,
+            b'F',
+            sds.frequency,
+            b'S',
+            sds.status_on,
+            b'\xff' * 8,
+        )
+    ).decode()
 
-    def encode_float(h: str, val: float) -> bytes:
-        return h.encode() + struct.pack('<d', val)
 
+def encode_state_data_raw(sds: api.schemas.StreetlampDeviceState) -> str:
+    """Encode FMC device state data in the compact untagged format."""
     return base64.b64encode(
-        encode_float('V', sds.voltage)
-        + encode_float('I', sds.current)
-        + encode_float('M', sds.energy_out)
-        + encode_float('E', sds.energy_in)
-        + encode_float('W', sds.power)
-        + encode_float('F', sds.frequency)
-        + b'S'
-        + (b'\x01' if sds.status_on else b'\x00')
-        + b'\xff\xff\xff\xff\xff\xff\xff\xff'
+        _STATE_STRUCT_RAW.pack(
+            sds.voltage,
+            sds.current,
+            sds.energy_out,
+            sds.energy_in,
+            sds.power,
+            sds.frequency,
+            sds.status_on,
+        )
     ).decode()
 
 
 def decode_state_data(s: str) -> api.schemas.StreetlampDeviceState:
-    """Decode FMC device state data."""
-    ndouble = 6
-    vals = [
-        struct.unpack('<d', x) if j < ndouble else (bool(x[0]),)
-        for j, x in enumerate(
-            [base64.b64decode(s)[i + 1 + 8 * i : 9 * (i + 1)] for i in range(7)]
-        )
-    ]
+    """Decode FMC device state data, tagged or compact."""
+    raw = base64.b64decode(s)
+    if len(raw) == _STATE_STRUCT_RAW.size:
+        (
+            voltage,
+            current,
+            energy_out,
+            energy_in,
+            power,
+            frequency,
+            status_on,
+        ) = _STATE_STRUCT_RAW.unpack(raw)
+    else:
+        (
+            voltage,
+            current,
+            energy_out,
+            energy_in,
+            power,
+            frequency,
+            status_on,
+        ) = _STATE_STRUCT_SKIP.unpack(raw)
     return api.schemas.StreetlampDeviceState(
-        voltage=vals[0][0],
-        current=vals[1][0],
-        energy_out=vals[2][0],
-        energy_in=vals[3][0],
-        power=vals[4][0],
-        frequency=vals[5][0],
-        status_on=vals[6][0],
+        voltage=voltage,
+        current=current,
+        energy_out=energy_out,
+        energy_in=energy_in,
+        power=power,
+        frequency=frequency,
+        status_on=status_on,
     )
 
 
+def _state_from_create(
+    ssc: api.schemas.StreetlampStateCreate,
+) -> api.models.StreetlampState:
+    """Build a streetlamp state model from a create schema."""
+    sds = decode_state_data(ssc.data)
+    return api.models.StreetlampState(
+        deduplication_id=ssc.deduplication_id,
+        time=ssc.time.astimezone(_TZ_SANTO_DOMINGO),
+        tenant_id=ssc.device_info.tenant_id,
+        tenant_name=ssc.device_info.tenant_name,
+        application_id=ssc.device_info.application_id,
+        application_name=ssc.device_info.application_name,
+        device_profile_id=ssc.device_info.device_profile_id,
+        device_profile_name=ssc.device_info.device_profile_name,
+        device_name=ssc.device_info.device_name,
+        dev_eui=ssc.device_info.dev_eui,
+        dev_addr=ssc.dev_addr,
+        dev_voltage=sds.voltage,
+        dev_current=sds.current,
+        dev_energy_out=sds.energy_out,
+        dev_energy_in=sds.energy_in,
+        dev_power=sds.power,
+        dev_frequency=sds.frequency,
+        dev_status_on=sds.status_on,
+    )
+
+
+def _check_state(
+    ss: api.models.StreetlampState,
+    ls: api.models.StreetlampState | None,
+) -> api.models.StreetlampAlarm | None:
+    """Check a state against the previous one, returning any alarm."""
+    max_power = 95.0
+    max_frequency = 65
+    max_ecr = 100000
+
+    if not _values_valid(
+        ss.dev_voltage, ss.dev_current, ss.dev_power, ss.dev_frequency
+    ):
+        return _make_alarm(
+            ss,
+            api.models.AlarmType.INVALID_VALUE,
+            api.models.AlarmSeverity.MINOR,
+        )
+
+    if ss.dev_power > max_power:
+        return _make_alarm(
+            ss,
+            api.models.AlarmType.OVER_POWER,
+            api.models.AlarmSeverity.CRITICAL,
+        )
+
+    if ss.dev_frequency > max_frequency:
+        return _make_alarm(
+            ss,
+            api.models.AlarmType.OVER_FREQUENCY,
+            api.models.AlarmSeverity.CRITICAL,
+        )
+
+    if ls is not None:
+        t = (ss.time - ls.time).total_seconds() // 3600
+        t = 1 if t == 0 else t
+        if (ss.dev_energy_in - ls.dev_energy_in) / t > max_ecr:
+            return _make_alarm(
+                ss,
+                api.models.AlarmType.OVER_ENERGY,
+                api.models.AlarmSeverity.MAJOR,
+            )
+
+    return None
+
+
 def _make_alarm(
     ss: api.models.StreetlampState,
     atype: api.models.AlarmType,
@@ -1368,103 +2004,104 @@ class StreetlampStateService:
             name='nl:streetlamp_states', fields={'value': state}
         )
 
+    async def _find_last(
+        self: Self, dev_eui: str
+    ) -> api.models.StreetlampState | None:
+        try:
+            h = await api.rs.db.hgetall(_LAST_STATE_KEY.format(dev_eui))
+        except redis.RedisError:
+            h = None
+        if h:
+            return api.models.StreetlampState(
+                dev_eui=dev_eui,
+                time=datetime.datetime.fromisoformat(h['time']),
+                dev_energy_in=float(h['energy_in']),
+            )
+        return await self.sstate_repo.find_latest_by_dev_eui(dev_eui)
+
+    @staticmethod
+    async def _cache_last(sss: Sequence[api.models.StreetlampState]) -> None:
+        try:
+            pipe = api.rs.db.pipeline()
+            for ss in sss:
+                pipe.hset(
+                    _LAST_STATE_KEY.format(ss.dev_eui),
+                    mapping={
+                        'time': ss.time.isoformat(),
+                        'energy_in': ss.dev_energy_in,
+                    },
+                )
+            await pipe.execute()
+        except redis.RedisError as e:
+            api.log.logger.warning('Failed caching last states: %s', e)
+
     async def create(
         self: Self, ssc: api.schemas.StreetlampStateCreate
     ) -> int | None:
         """Create streetlamp state."""
-        sds = decode_state_data(ssc.data)
-        time = ssc.time.astimezone(zoneinfo.ZoneInfo('America/Santo_Domingo'))
-        ss = api.models.StreetlampState(
-            deduplication_id=ssc.deduplication_id,
-            time=time,
-            tenant_id=ssc.device_info.tenant_id,
-            tenant_name=ssc.device_info.tenant_name,
-            application_id=ssc.device_info.application_id,
-            application_name=ssc.device_info.application_name,
-            device_profile_id=ssc.device_info.device_profile_id,
-            device_profile_name=ssc.device_info.device_profile_name,
-            device_name=ssc.device_info.device_name,
-            dev_eui=ssc.device_info.dev_eui,
-            dev_addr=ssc.dev_addr,
-            dev_voltage=sds.voltage,
-            dev_current=sds.current,
-            dev_energy_out=sds.energy_out,
-            dev_energy_in=sds.energy_in,
-            dev_power=sds.power,
-            dev_frequency=sds.frequency,
-            dev_status_on=sds.status_on,
-        )
-
-        min_valid_value = 0.0001
-        max_valid_value = 1000.0
-
-        if (
-            math.isnan(ss.dev_voltage)
-            or ss.dev_voltage < min_valid_value
-            or ss.dev_voltage > max_valid_value
-            or math.isnan(ss.dev_current)
-            or ss.dev_current < min_valid_value
-            or ss.dev_current > max_valid_value
-            or math.isnan(ss.dev_power)
-            or ss.dev_power < min_valid_value
-            or ss.dev_power > max_valid_value
-            or math.isnan(ss.dev_frequency)
-            or ss.dev_frequency < min_valid_value
-            or ss.dev_frequency > max_valid_value
-        ):
-            await self.salarm_repo.insert(
-                _make_alarm(
-                    ss,
-                    api.models.AlarmType.INVALID_VALUE,
-                    api.models.AlarmSeverity.MINOR,
-                )
-            )
-            return None
-
-        max_power = 95.0
-        if ss.dev_power > max_power:
-            await self.salarm_repo.insert(
-                _make_alarm(
-                    ss,
-                    api.models.AlarmType.OVER_POWER,
-                    api.models.AlarmSeverity.CRITICAL,
-                )
-            )
-            return None
+        ss = _state_from_create(ssc)
+        ls = await self._find_last(ss.dev_eui)
 
-        max_frequency = 65
-        if ss.dev_frequency > max_frequency:
-            await self.salarm_repo.insert(
-                _make_alarm(
-                    ss,
-                    api.models.AlarmType.OVER_FREQUENCY,
-                    api.models.AlarmSeverity.CRITICAL,
-                )
-            )
+        if (alarm := _check_state(ss, ls)) is not None:
+            await self.salarm_repo.insert(alarm)
             return None
 
-        max_ecr = 100000
-        ls = await self.sstate_repo.find_latest_by_dev_eui(ss.dev_eui)
-        if ls is not None:
-            t = (ss.time - ls.time).total_seconds() // 3600
-            t = 1 if t == 0 else t
-            if (ss.dev_energy_in - ls.dev_energy_in) / t > max_ecr:
-                await self.salarm_repo.insert(
-                    _make_alarm(
-                        ss,
-                        api.models.AlarmType.OVER_ENERGY,
-                        api.models.AlarmSeverity.MAJOR,
-                    )
-                )
-                return None
-
         if (ssid := await self.sstate_repo.insert(ss)) is not None:
             await self.stream_repo.update_producer(
-                f'streetlamp:state:hourly:{ssc.device_info.dev_eui}',
-                api.utils.round_to_hour(time),
+                f'streetlamp:state:hourly:{ss.dev_eui}',
+                api.utils.round_to_hour(ss.time),
             )
+            await self._cache_last([ss])
         return ssid
 
+    async def create_many(
+        self: Self, sscs: Sequence[api.schemas.StreetlampStateCreate]
+    ) -> int:
+        """Create many streetlamp states with batched statements."""
+        sss = [_state_from_create(ssc) for ssc in sscs]
+        euis = list({ss.dev_eui for ss in sss})
+        latest: dict[str, api.models.StreetlampState] = {}
+        try:
+            pipe = api.rs.db.pipeline()
+            for eui in euis:
+                pipe.hgetall(_LAST_STATE_KEY.format(eui))
+            for eui, h in zip(euis, await pipe.execute(), strict=True):
+                if h:
+                    latest[eui] = api.models.StreetlampState(
+                        dev_eui=eui,
+                        time=datetime.datetime.fromisoformat(h['time']),
+                        dev_energy_in=float(h['energy_in']),
+                    )
+        except redis.RedisError:
+            latest.clear()
+        for ls in await self.sstate_repo.find_latest_by_dev_euis(
+            [e for e in euis if e not in latest]
+        ):
+            latest[ls.dev_eui] = ls
+
+        accepted = []
+        alarms = []
+        producer_tss: dict[str, datetime.datetime] = {}
+        for ss in sss:
+            if (alarm := _check_state(ss, latest.get(ss.dev_eui))) is not None:
+                alarms.append(alarm)
+                continue
+            accepted.append(ss)
+            latest[ss.dev_eui] = ss
+            strname = f'streetlamp:state:hourly:{ss.dev_eui}'
+            hour = api.utils.round_to_hour(ss.time)
+            if strname not in producer_tss or producer_tss[strname] < hour:
+                producer_tss[strname] = hour
+
+        await self.salarm_repo.insert_many(alarms)
+        ssids = await self.sstate_repo.insert_many(accepted)
+        if ssids:
+            await self.stream_repo.update_producers(producer_tss)
+            await self._cache_last(
+                [latest[eui] for eui in {ss.dev_eui for ss in accepted}]
+            )
+        return len(ssids)
+
 
 @dataclasses.dataclass
 class _StreamDataRange:
@@ -1474,6 +2111,46 @@ class _StreamDataRange:
     t1: datetime.datetime
 
 
+def _get_stream_range(
+    ss_str: api.models.StreamState | None,
+    odse: api.models.DailyStreetlampState | None,
+) -> _StreamDataRange | None:
+    """Compute the pending data range of a weekly or monthly stream."""
+    if ss_str is None or ss_str.producer_ts is None:
+        return None
+
+    if ss_str.consumer_ts is None:
+        if odse is None:
+            return None
+        t0 = odse.day
+    else:
+        t0 = ss_str.consumer_ts
+    t1 = ss_str.producer_ts
+
+    if t0 == t1:
+        return None
+
+    return _StreamDataRange(
+        api.utils.convert_to_default_tz(t0),
+        api.utils.convert_to_default_tz(t1),
+    )
+
+
+def _dev_euis_without_consumer(
+    lamps: Sequence[api.models.Streetlamp],
+    ss_map: dict[str, api.models.StreamState],
+    period: str,
+) -> list[str]:
+    """List devices whose stream has data but no consumer timestamp yet."""
+    return [
+        s.device_eui
+        for s in lamps
+        if (ss := ss_map.get(f'streetlamp:state:{period}:{s.device_eui}'))
+        and ss.producer_ts is not None
+        and ss.consumer_ts is None
+    ]
+
+
 class StreetlampHourlyAggregationService:
     """This class provides functions for consolidating energy data."""
 
@@ -1531,7 +2208,9 @@ class StreetlampHourlyAggregationService:
 
     async def aggregate(self: Self) -> int:
         """Run hourly aggregation process."""
-        tnr = 0
+        ranges: dict[str, tuple[datetime.datetime, datetime.datetime]] = {}
+        consumer_tss: dict[str, datetime.datetime] = {}
+        producer_tss: dict[str, datetime.datetime] = {}
         for s in await self.streetlamp_repo.find_all():
             strname = f'streetlamp:state:hourly:{s.device_eui}'
             match await self._get_hourly_range(strname, s.device_eui):
@@ -1539,21 +2218,20 @@ class StreetlampHourlyAggregationService:
                     pass
 
                 case _StreamDataRange(t0=t0, t1=t1):
-                    nr = await self.hourly_state_repo.pull(s.device_eui, t0, t1)
-                    api.log.logger.info(
-                        'Stream [%s][%s -- %s]: %s rows(s) inserted',
-                        strname,
-                        t0,
-                        t1,
-                        nr,
+                    ranges[s.device_eui] = (t0, t1)
+                    consumer_tss[strname] = t1
+                    producer_tss[f'streetlamp:state:daily:{s.device_eui}'] = (
+                        api.utils.round_to_day(t1)
                     )
-
-                    await self.streamst_repo.update_consumer(strname, t1)
-                    await self.streamst_repo.update_producer(
-                        f'streetlamp:state:daily:{s.device_eui}',
-                        api.utils.round_to_day(t1),
-                    )
-                    tnr += nr
+        tnr = await self.hourly_state_repo.pull_many(ranges)
+        api.log.logger.debug('Hourly aggregation ranges: %s', ranges)
+        api.log.logger.info(
+            'Hourly aggregation: %s stream(s), %s row(s) inserted',
+            len(ranges),
+            tnr,
+        )
+        await self.streamst_repo.update_consumers(consumer_tss)
+        await self.streamst_repo.update_producers(producer_tss)
         return tnr
 
 
@@ -1614,7 +2292,9 @@ class StreetlampDailyAggregationService:
 
     async def aggregate(self: Self) -> int:
         """Run daily aggregation process."""
-        tnd = 0
+        ranges: dict[str, tuple[datetime.datetime, datetime.datetime]] = {}
+        consumer_tss: dict[str, datetime.datetime] = {}
+        producer_tss: dict[str, datetime.datetime] = {}
         for s in await self.streetlamp_repo.find_all():
             strname = f'streetlamp:state:daily:{s.device_eui}'
             match await self._get_daily_range(strname, s.device_eui):
@@ -1622,31 +2302,78 @@ class StreetlampDailyAggregationService:
                     pass
 
                 case _StreamDataRange(t0=t0, t1=t1):
-                    nd = await self.daily_state_repo.pull(s.device_eui, t0, t1)
-                    api.log.logger.info(
-                        'Stream [%s][%s -- %s]: %s rows(s) inserted',
-                        strname,
-                        t0,
-                        t1,
-                        nd,
-                    )
-
-                    await self.streamst_repo.update_consumer(strname, t1)
-                    await self.streamst_repo.update_producer(
-                        f'streetlamp:state:weekly:{s.device_eui}',
-                        api.utils.round_to_week(t1),
-                    )
-                    await self.streamst_repo.update_producer(
-                        f'streetlamp:state:monthly:{s.device_eui}',
-                        api.utils.round_to_month(t1),
+                    ranges[s.device_eui] = (t0, t1)
+                    consumer_tss[strname] = t1
+                    producer_tss[f'streetlamp:state:weekly:{s.device_eui}'] = (
+                        api.utils.round_to_week(t1)
                     )
-                    tnd += nd
+                    producer_tss[
+                        f'streetlamp:state:monthly:{s.device_eui}'
+                    ] = api.utils.round_to_month(t1)
+        tnd = await self.daily_state_repo.pull_many(ranges)
+        api.log.logger.debug('Daily aggregation ranges: %s', ranges)
+        api.log.logger.info(
+            'Daily aggregation: %s stream(s), %s row(s) inserted',
+            len(ranges),
+            tnd,
+        )
+        await self.streamst_repo.update_consumers(consumer_tss)
+        await self.streamst_repo.update_producers(producer_tss)
         return tnd
 
 
-class StreetlampWeeklyAggregationService:
+class _PeriodAggregationBase:
+    """This class implements the shared weekly/monthly aggregation flow."""
+
+    period: ClassVar[str]
+
+    streetlamp_repo: api.repositories.StreetlampRepository
+    streamst_repo: api.repositories.StreamStateRepository
+    daily_state_repo: api.repositories.DailyStreetlampStateRepository
+    state_repo: (
+        api.repositories.WeeklyStreetlampStateRepository
+        | api.repositories.MonthlyStreetlampStateRepository
+    )
+
+    async def aggregate(self: Self) -> int:
+        """Run the aggregation process for this period."""
+        lamps = await self.streetlamp_repo.find_all()
+        prefix = f'streetlamp:state:{self.period}:'
+        names = {s.device_eui: prefix + s.device_eui for s in lamps}
+        ss_map = await self.streamst_repo.find_by_names(list(names.values()))
+        odse_map = await self.daily_state_repo.find_oldest_by_dev_euis(
+            _dev_euis_without_consumer(lamps, ss_map, self.period)
+        )
+        ranges: dict[str, tuple[datetime.datetime, datetime.datetime]] = {}
+        consumer_tss: dict[str, datetime.datetime] = {}
+        for s in lamps:
+            strname = names[s.device_eui]
+            match _get_stream_range(
+                ss_map.get(strname), odse_map.get(s.device_eui)
+            ):
+                case None:
+                    pass
+
+                case _StreamDataRange(t0=t0, t1=t1):
+                    ranges[s.device_eui] = (t0, t1)
+                    consumer_tss[strname] = t1
+        tnr = await self.state_repo.pull_many(ranges)
+        api.log.logger.debug('%s aggregation ranges: %s', self.period, ranges)
+        api.log.logger.info(
+            '%s aggregation: %s stream(s), %s row(s) inserted',
+            self.period.capitalize(),
+            len(ranges),
+            tnr,
+        )
+        await self.streamst_repo.update_consumers(consumer_tss)
+        return tnr
+
+
+class StreetlampWeeklyAggregationService(_PeriodAggregationBase):
     """This class provides functions for consolidating energy data."""
 
+    period: ClassVar[str] = 'weekly'
+
     def __init__(
         self: Self,
         streetlamp_repo: Annotated[
@@ -1670,62 +2397,14 @@ class StreetlampWeeklyAggregationService:
         self.streetlamp_repo = streetlamp_repo
         self.streamst_repo = streamst_repo
         self.daily_state_repo = daily_state_repo
-        self.weekly_state_repo = weekly_state_repo
-
-    async def _get_weekly_range(
-        self: Self, strname: str, dev_eui: str
-    ) -> _StreamDataRange | None:
-        ss_str = await self.streamst_repo.find_by_name(strname)
+        self.state_repo = weekly_state_repo
 
-        if ss_str is None or ss_str.producer_ts is None:
-            return None
-
-        if ss_str.consumer_ts is None:
-            if odse := await self.daily_state_repo.find_oldest_by_dev_eui(
-                dev_eui
-            ):
-                t0 = odse.day
-            else:
-                return None
-        else:
-            t0 = ss_str.consumer_ts
-        t1 = ss_str.producer_ts
 
-        if t0 == t1:
-            return None
-
-        return _StreamDataRange(
-            api.utils.convert_to_default_tz(t0),
-            api.utils.convert_to_default_tz(t1),
-        )
-
-    async def aggregate(self: Self) -> int:
-        """Run weekly aggregation process."""
-        tnw = 0
-        for s in await self.streetlamp_repo.find_all():
-            strname = f'streetlamp:state:weekly:{s.device_eui}'
-            match await self._get_weekly_range(strname, s.device_eui):
-                case None:
-                    pass
-
-                case _StreamDataRange(t0=t0, t1=t1):
-                    nw = await self.weekly_state_repo.pull(s.device_eui, t0, t1)
-                    api.log.logger.info(
-                        'Stream [%s][%s -- %s]: %s rows(s) inserted',
-                        strname,
-                        t0,
-                        t1,
-                        nw,
-                    )
-
-                    await self.streamst_repo.update_consumer(strname, t1)
-                    tnw += nw
-        return tnw
-
-
-class StreetlampMonthlyAggregationService:
+class StreetlampMonthlyAggregationService(_PeriodAggregationBase):
     """This class provides functions for consolidating energy data."""
 
+    period: ClassVar[str] = 'monthly'
+
     def __init__(
         self: Self,
         streetlamp_repo: Annotated[
@@ -1749,59 +2428,7 @@ class StreetlampMonthlyAggregationService:
         self.streetlamp_repo = streetlamp_repo
         self.streamst_repo = streamst_repo
         self.daily_state_repo = daily_state_repo
-        self.monthly_state_repo = monthly_state_repo
-
-    async def _get_monthly_range(
-        self: Self, strname: str, dev_eui: str
-    ) -> _StreamDataRange | None:
-        ss_str = await self.streamst_repo.find_by_name(strname)
-
-        if ss_str is None or ss_str.producer_ts is None:
-            return None
-
-        if ss_str.consumer_ts is None:
-            if odse := await self.daily_state_repo.find_oldest_by_dev_eui(
-                dev_eui
-            ):
-                t0 = odse.day
-            else:
-                return None
-        else:
-            t0 = ss_str.consumer_ts
-        t1 = ss_str.producer_ts
-
-        if t0 == t1:
-            return None
-
-        return _StreamDataRange(
-            api.utils.convert_to_default_tz(t0),
-            api.utils.convert_to_default_tz(t1),
-        )
-
-    async def aggregate(self: Self) -> int:
-        """Run monthly aggregation process."""
-        tnm = 0
-        for s in await self.streetlamp_repo.find_all():
-            strname = f'streetlamp:state:monthly:{s.device_eui}'
-            match await self._get_monthly_range(strname, s.device_eui):
-                case None:
-                    pass
-
-                case _StreamDataRange(t0=t0, t1=t1):
-                    nm = await self.monthly_state_repo.pull(
-                        s.device_eui, t0, t1
-                    )
-                    api.log.logger.info(
-                        'Stream [%s][%s -- %s]: %s rows(s) inserted',
-                        strname,
-                        t0,
-                        t1,
-                        nm,
-                    )
-
-                    await self.streamst_repo.update_consumer(strname, t1)
-                    tnm += nm
-        return tnm
+        self.state_repo = monthly_state_repo
 
 
 class AccountService:
@@ -1823,10 +2450,19 @@ class AccountService:
         return api.schemas.Account.from_orm(a)
 
 
+_ETCO2_PER_WH = 6.99e-7
+
+
 def energy_to_co2(energy: float) -> float:
-    """Convert energy to CO2 metric tons."""
-    etco2 = 6.99e-4
-    return round(etco2 * (energy / 1000.0), 1)
+    """Convert energy in Wh to CO2 metric tons."""
+    return round(_ETCO2_PER_WH * energy, 1)
+
+
+_device_profile_cache: dict[str, tuple[float, dict | None]] = {}
+
+_geo_states_cache: tuple[float, list[api.schemas.StreetlampGeoState]] | None = (
+    None
+)
 
 
 class DashboardService:
@@ -1874,6 +2510,42 @@ class DashboardService:
         cs_streetlamp_dp_id: str,
     ) -> api.schemas.Dashboard:
         """Get dashboard."""
+        connectivity, summs = await asyncio.gather(
+            self._get_connectivity_summary(cs_app_id, cs_streetlamp_dp_id),
+            self._get_db_summaries(),
+        )
+        (
+            today_summ,
+            yesterday_summ,
+            last_week_summ,
+            last_month_summ,
+            mtd_daily_summs,
+            mtd_weekly_summs,
+            ytd_montly_summs,
+            alarms,
+            life_span,
+            geo_states,
+        ) = summs
+
+        return api.schemas.Dashboard(
+            connectivity=connectivity,
+            alarms=alarms,
+            life_span=life_span,
+            today_energy=self._get_energy_summary(today_summ),
+            yesterday_energy=self._get_energy_summary(yesterday_summ),
+            last_week_energy=self._get_energy_summary(last_week_summ),
+            last_month_energy=self._get_energy_summary(last_month_summ),
+            mtd_daily_energy=self._get_energy_to_date_summary(mtd_daily_summs),
+            mtd_weekly_energy=self._get_energy_to_date_summary(
+                mtd_weekly_summs
+            ),
+            ytd_monthly_energy=self._get_energy_to_date_summary(
+                ytd_montly_summs
+            ),
+            geo_states=geo_states,
+        )
+
+    async def _get_db_summaries(self: Self) -> tuple:
         today_summ = (
             api.schemas.StreetlampStateSummary.from_orm(today_summ_)
             if (
@@ -1918,63 +2590,59 @@ class DashboardService:
             else None
         )
 
-        mtd_daily_summs = [
-            api.schemas.StreetlampStatePointwiseSummary.from_orm(ss)
-            for ss in await self.daily_state_repo.pointwise_summary(
-                from_=api.utils.current_month(),
-                to=api.utils.yesterday_midnight(),
-            )
-        ] + (
+        mtd_daily_summs = await self.daily_state_repo.pointwise_summary(
+            from_=api.utils.current_month(),
+            to=api.utils.yesterday_midnight(),
+        ) + (
             []
             if today_summ is None
             else [
                 api.schemas.StreetlampStatePointwiseSummary(
                     **(
-                        today_summ.model_dump()
+                        _adapter(
+                            api.schemas.StreetlampStateSummary
+                        ).dump_python(today_summ)
                         | {'ts': api.utils.today_midnight()}
                     )
                 )
             ]
         )
 
-        mtd_weekly_summs = [
-            api.schemas.StreetlampStatePointwiseSummary.from_orm(ss)
-            for ss in await self.weekly_state_repo.pointwise_summary(
-                from_=api.utils.current_month(), to=api.utils.now()
-            )
-        ]
+        mtd_weekly_summs = await self.weekly_state_repo.pointwise_summary(
+            from_=api.utils.current_month(), to=api.utils.now()
+        )
 
-        ytd_montly_summs = [
-            api.schemas.StreetlampStatePointwiseSummary.from_orm(ss)
-            for ss in await self.monthly_state_repo.pointwise_summary(
-                from_=api.utils.current_year(), to=api.utils.now()
-            )
-        ]
+        ytd_montly_summs = await self.monthly_state_repo.pointwise_summary(
+            from_=api.utils.current_year(), to=api.utils.now()
+        )
 
-        return api.schemas.Dashboard(
-            connectivity=await self._get_connectivity_summary(
-                cs_app_id, cs_streetlamp_dp_id
-            ),
-            alarms=await self._get_alarms_summary(),
-            life_span=await self._get_life_span_summary(),
-            today_energy=await self._get_energy_summary(today_summ),
-            yesterday_energy=await self._get_energy_summary(yesterday_summ),
-            last_week_energy=await self._get_energy_summary(last_week_summ),
-            last_month_energy=await self._get_energy_summary(last_month_summ),
-            mtd_daily_energy=self._get_energy_to_date_summary(mtd_daily_summs),
-            mtd_weekly_energy=self._get_energy_to_date_summary(
-                mtd_weekly_summs
-            ),
-            ytd_monthly_energy=self._get_energy_to_date_summary(
-                ytd_montly_summs
-            ),
-            geo_states=await self._get_geo_states(),
+        return (
+            today_summ,
+            yesterday_summ,
+            last_week_summ,
+            last_month_summ,
+            mtd_daily_summs,
+            mtd_weekly_summs,
+            ytd_montly_summs,
+            await self._get_alarms_summary(),
+            await self._get_life_span_summary(),
+            await self._get_geo_states(),
         )
 
     async def _get_connectivity_summary(
         self: Self, cs_app_id: str, cs_streetlamp_dp_id: str
     ) -> api.schemas.StreetlampsConnectivity:
-        dp = self.chirpstack_serv.device_profile.read(cs_streetlamp_dp_id)
+        entry = _device_profile_cache.get(cs_streetlamp_dp_id)
+        if entry is not None and time.monotonic() < entry[0]:
+            dp = entry[1]
+        else:
+            dp = await self.chirpstack_serv.device_profile.read(
+                cs_streetlamp_dp_id
+            )
+            _device_profile_cache[cs_streetlamp_dp_id] = (
+                time.monotonic() + _DEVICE_PROFILE_TTL_SECONDS,
+                dp,
+            )
         if dp is None:
             return api.schemas.StreetlampsConnectivity(
                 active=0,
@@ -1982,23 +2650,26 @@ class DashboardService:
                 never_seen=0,
             )
         uli = dp.get('uplinkInterval', 0)
-        dlr = self.chirpstack_serv.device.reads(cs_app_id, 0, 0)
+        dlr = await self.chirpstack_serv.device.reads(cs_app_id, 0, 0)
         n = dlr.get('totalCount', 0)
         active = 0
         never_seen = 0
         inactive = 0
-        for m in range(0, n, 100):
-            dlr = self.chirpstack_serv.device.reads(cs_app_id, m, 100)
+        dlrs = await asyncio.gather(
+            *(
+                self.chirpstack_serv.device.reads(cs_app_id, m, 100)
+                for m in range(0, n, 100)
+            )
+        )
+        threshold = datetime.timedelta(seconds=uli)
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        for dlr in dlrs:
             for x in dlr['result']:
                 if 'lastSeenAt' not in x:
                     never_seen += 1
                 elif uli > 0:
-                    lsa = dateutil.parser.parse(x['lastSeenAt']).astimezone(
-                        pytz.UTC
-                    )
-                    t0 = lsa + datetime.timedelta(seconds=uli)
-                    t1 = datetime.datetime.now(tz=pytz.UTC)
-                    if t0 > t1:
+                    lsa = datetime.datetime.fromisoformat(x['lastSeenAt'])
+                    if lsa + threshold > now:
                         active += 1
                     else:
                         inactive += 1
@@ -2032,32 +2703,41 @@ class DashboardService:
     async def _get_geo_states(
         self: Self,
     ) -> list[api.schemas.StreetlampGeoState]:
-        return [
+        global _geo_states_cache  # noqa: PLW0603
+        if (
+            _geo_states_cache is not None
+            and time.monotonic() < _geo_states_cache[0]
+        ):
+            return _geo_states_cache[1]
+        states = [
             api.schemas.StreetlampGeoState(
                 name=s.name, dev_eui=s.device_eui, lon=s.lon, lat=s.lat
             )
             for s in await self.streetlamp_repo.find_all(limit=None)
         ]
+        _geo_states_cache = (
+            time.monotonic() + _GEO_STATES_TTL_SECONDS,
+            states,
+        )
+        return states
 
-    async def _get_energy_summary(
+    def _get_energy_summary(
         self: Self,
         summ: api.schemas.StreetlampStateSummary | None,
     ) -> api.schemas.StreetlampEnergySummary:
-        return api.schemas.StreetlampEnergySummary(
-            consumption=await self._get_energy_consumption_summary(summ),
-            savings=await self._get_energy_savings_summary(summ),
-            dimming_savings=await self._get_energy_dimming_savings_summary(
-                summ
-            ),
-            co2_savings=await self._get_energy_co2_savings_summary(summ),
+        return api.schemas.StreetlampEnergySummary.model_construct(
+            consumption=self._get_energy_consumption_summary(summ),
+            savings=self._get_energy_savings_summary(summ),
+            dimming_savings=self._get_energy_dimming_savings_summary(summ),
+            co2_savings=self._get_energy_co2_savings_summary(summ),
         )
 
-    async def _get_energy_consumption_summary(
+    def _get_energy_consumption_summary(
         self: Self,
         summ: api.schemas.StreetlampStateSummary | None,
     ) -> api.schemas.StreetlampsEnergyConsumption:
         if summ is None:
-            return api.schemas.StreetlampsEnergyConsumption(
+            return api.schemas.StreetlampsEnergyConsumption.model_construct(
                 total_in_kw=0.0,
                 avg_in_watts=0.0,
             )
@@ -2065,17 +2745,17 @@ class DashboardService:
         avg_in_watts = round(
             summ.energy_in / summ.ndevices if summ.ndevices != 0 else 0.0, 2
         )
-        return api.schemas.StreetlampsEnergyConsumption(
+        return api.schemas.StreetlampsEnergyConsumption.model_construct(
             total_in_kw=total_in_kw,
             avg_in_watts=avg_in_watts,
         )
 
-    async def _get_energy_savings_summary(
+    def _get_energy_savings_summary(
         self: Self,
         summ: api.schemas.StreetlampStateSummary | None,
     ) -> api.schemas.StreetlampsEnergySavings:
         if summ is None:
-            return api.schemas.StreetlampsEnergySavings(
+            return api.schemas.StreetlampsEnergySavings.model_construct(
                 percentage=0.0,
                 avg_in_watts=0.0,
             )
@@ -2085,17 +2765,17 @@ class DashboardService:
         avg_in_watts = round(
             savings / summ.ndevices if summ.ndevices != 0 else 0.0, 2
         )
-        return api.schemas.StreetlampsEnergySavings(
+        return api.schemas.StreetlampsEnergySavings.model_construct(
             percentage=percentage,
             avg_in_watts=avg_in_watts,
         )
 
-    async def _get_energy_dimming_savings_summary(
+    def _get_energy_dimming_savings_summary(
         self: Self,
         summ: api.schemas.StreetlampStateSummary | None,
     ) -> api.schemas.StreetlampsDimmingSavings:
         if summ is None:
-            return api.schemas.StreetlampsDimmingSavings(
+            return api.schemas.StreetlampsDimmingSavings.model_construct(
                 percentage=0.0,
                 avg_in_watts=0.0,
             )
@@ -2105,22 +2785,22 @@ class DashboardService:
         avg_in_watts = round(
             savings / summ.ndevices if summ.ndevices != 0 else 0.0, 2
         )
-        return api.schemas.StreetlampsDimmingSavings(
+        return api.schemas.StreetlampsDimmingSavings.model_construct(
             percentage=percentage,
             avg_in_watts=avg_in_watts,
         )
 
-    async def _get_energy_co2_savings_summary(
+    def _get_energy_co2_savings_summary(
         self: Self,
         summ: api.schemas.StreetlampStateSummary | None,
     ) -> api.schemas.StreetlampsCo2Savings:
         if summ is None:
-            return api.schemas.StreetlampsCo2Savings(
+            return api.schemas.StreetlampsCo2Savings.model_construct(
                 total_in_ton=0.0,
                 avg_in_ton=0.0,
             )
         savings = 250 * (summ.on_time / 3600.0) - summ.energy_in
-        return api.schemas.StreetlampsCo2Savings(
+        return api.schemas.StreetlampsCo2Savings.model_construct(
             total_in_ton=energy_to_co2(savings),
             avg_in_ton=energy_to_co2(
                 savings / summ.ndevices if summ.ndevices != 0 else 0.0
@@ -2131,25 +2811,21 @@ class DashboardService:
         self: Self,
         summs: list[api.schemas.StreetlampStatePointwiseSummary],
     ) -> list[api.schemas.StreetlampEnergyPoint]:
-        return [
-            api.schemas.StreetlampEnergyPoint(
-                ts=summ.ts,
-                consumption=round(summ.energy_in / 1000, 2),
-                savings=round(
-                    (250 * (summ.on_time / 3600.0) - summ.energy_in) / 1000, 2
-                ),
-                dimming_savings=round(
-                    (90 * (summ.on_time / 3600.0) - summ.energy_in) / 1000, 2
-                ),
-                co2_savings=energy_to_co2(
-                    round(
-                        (250 * (summ.on_time / 3600.0) - summ.energy_in) / 1000,
-                        2,
-                    )
-                ),
+        points = []
+        for summ in summs:
+            on_hours = summ.on_time / 3600.0
+            savings = 250 * on_hours - summ.energy_in
+            dimming_savings = 90 * on_hours - summ.energy_in
+            points.append(
+                api.schemas.StreetlampEnergyPoint.model_construct(
+                    ts=summ.ts,
+                    consumption=round(summ.energy_in / 1000, 2),
+                    savings=round(savings / 1000, 2),
+                    dimming_savings=round(dimming_savings / 1000, 2),
+                    co2_savings=energy_to_co2(savings),
+                )
             )
-            for summ in summs
-        ]
+        return points
 
 
 class SeedService:
@@ -2173,11 +2849,11 @@ class SeedService:
 
     async def sow(self: Self) -> None:
         """Create initial entities."""
-        cs = self.chirpstack_serv.get_current_state()
+        cs = await self.chirpstack_serv.get_current_state()
         while cs != ChirpStackState.READY:
             api.log.logger.error(f'Invalid ChirpStack state : {cs}')
             await asyncio.sleep(30)
-            cs = self.chirpstack_serv.get_current_state()
+            cs = await self.chirpstack_serv.get_current_state()
 
         if a := await self._create_netolight_account():
             await self._create_netolight_admin_user(a.id)
@@ -2188,40 +2864,42 @@ class SeedService:
     ) -> dict | None:
         if (
             tenant_id
-            and (t := self.chirpstack_serv.tenant.read(tenant_id)) is not None
+            and (t := await self.chirpstack_serv.tenant.read(tenant_id))
+            is not None
         ):
             return t
 
-        r = self.chirpstack_serv.tenant.create(
+        r = await self.chirpstack_serv.tenant.create(
             name='NetoLight', description='NetoLight default tenant'
         )
-        return self.chirpstack_serv.tenant.read(r['id'])
+        return await self.chirpstack_serv.tenant.read(r['id'])
 
     async def _read_or_create_app(
         self: Self, tenant_id: str, app_id: str | None = None
     ) -> dict | None:
         if (
             app_id
-            and (a := self.chirpstack_serv.application.read(app_id)) is not None
+            and (a := await self.chirpstack_serv.application.read(app_id))
+            is not None
         ):
             return a
 
-        r = self.chirpstack_serv.application.create(
+        r = await self.chirpstack_serv.application.create(
             tenant_id=tenant_id,
             name='NetoLight',
             description='NetoLight default app',
         )
-        return self.chirpstack_serv.application.read(r['id'])
+        return await self.chirpstack_serv.application.read(r['id'])
 
     async def _read_or_create_streetlamp_dp(
         self: Self, tenant_id: str, dev_prof_id: str | None = None
     ) -> dict | None:
         if dev_prof_id and (
-            d := self.chirpstack_serv.device_profile.read(dev_prof_id)
+            d := await self.chirpstack_serv.device_profile.read(dev_prof_id)
         ):
             return d
 
-        r = self.chirpstack_serv.device_profile.create(
+        r = await self.chirpstack_serv.device_profile.create(
             tenant_id=tenant_id,
             name='NetoLightLamp',
             description='NetoLight default streetlamp device profile',
@@ -2230,29 +2908,32 @@ class SeedService:
             reg_params_revision=1,
             adr_algorithm_id='Default ADR algorithm (LoRa only)',
         )
-        return self.chirpstack_serv.device_profile.read(r['id'])
+        return await self.chirpstack_serv.device_profile.read(r['id'])
 
     async def _read_or_create_streetlamp_multicast_group(
         self: Self, app_id: str
     ) -> dict | None:
         name = 'Default'
-        if mg := self.chirpstack_serv.multicast_group.read_by_name(
+        if mg := await self.chirpstack_serv.multicast_group.read_by_name(
             app_id, name
         ):
             return mg
 
-        r = self.chirpstack_serv.multicast_group.create(
+        r = await self.chirpstack_serv.multicast_group.create(
             app_id=app_id,
             name=name,
         )
-        return self.chirpstack_serv.multicast_group.read(r['id'])
+        return await self.chirpstack_serv.multicast_group.read(r['id'])
 
     async def _read_or_create_http_integration(
         self: Self, app_id: str, event_endpoint_url: str
     ) -> dict:
-        i = self.chirpstack_serv.application.get_http_integration(app_id)
+        i = await self.chirpstack_serv.application.get_http_integration(
+            app_id
+        )
         if i is None:
-            return self.chirpstack_serv.application.create_http_integration(
+            cs_app = self.chirpstack_serv.application
+            return await cs_app.create_http_integration(
                 app_id=app_id, encoding=0, event_endpoint_url=event_endpoint_url
             )
         return i
@@ -2316,7 +2997,9 @@ class SeedService:
             u = api.models.User(
                 account_id=aid,
                 email='admin@netolight.com',
-                hashed_password=_pwd_context.hash('1234'),
+                hashed_password=await asyncio.to_thread(
+                    _hash_password, '1234'
+                ),
                 first_name='Admin',
                 last_name='Admin',
                 role='super-admin',
@@ -1,31 +1,33 @@
 """This module provides utilities functions."""
 
 import datetime
+import functools
 import zoneinfo
 
+_TZ = zoneinfo.ZoneInfo('America/Santo_Domingo')
+_UTC = zoneinfo.ZoneInfo('UTC')
+
 
 def utcnow() -> datetime.datetime:
     """Return current datetime."""
-    return datetime.datetime.now(tz=zoneinfo.ZoneInfo('UTC'))
+    return datetime.datetime.now(tz=_UTC)
 
 
 def now() -> datetime.datetime:
     """Return current datetime."""
-    return datetime.datetime.now(tz=zoneinfo.ZoneInfo('America/Santo_Domingo'))
+    return datetime.datetime.now(tz=_TZ)
 
 
 def today_midnight() -> datetime.datetime:
     """Return today midnight datetime."""
-    return datetime.datetime.combine(now(), datetime.time.min).astimezone(
-        zoneinfo.ZoneInfo('America/Santo_Domingo')
-    )
+    return now().replace(hour=0, minute=0, second=0, microsecond=0)
 
 
 def yesterday_midnight() -> datetime.datetime:
     """Return yesterday midnight datetime."""
-    return datetime.datetime.combine(
-        now() - datetime.timedelta(days=1), datetime.time.min
-    ).astimezone(zoneinfo.ZoneInfo('America/Santo_Domingo'))
+    return (now() - datetime.timedelta(days=1)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
 
 
 def last_week() -> datetime.datetime:
@@ -34,37 +36,28 @@ def last_week() -> datetime.datetime:
     return t - datetime.timedelta(days=t.weekday(), weeks=1)
 
 
+@functools.lru_cache(maxsize=8)
+def _month_floor(year: int, month: int) -> datetime.datetime:
+    return datetime.datetime(year=year, month=month, day=1, tzinfo=_TZ)
+
+
 def current_month() -> datetime.datetime:
-    """Return datetime of the first day of last month."""
+    """Return datetime of the first day of the current month."""
     dt = now()
-    return datetime.datetime(
-        year=dt.year,
-        month=dt.month,
-        day=1,
-        tzinfo=zoneinfo.ZoneInfo('America/Santo_Domingo'),
-    )
+    return _month_floor(dt.year, dt.month)
 
 
 def last_month() -> datetime.datetime:
     """Return datetime of the first day of last month."""
     dt = now()
-    return datetime.datetime(
-        year=dt.year,
-        month=dt.month - 1,
-        day=1,
-        tzinfo=zoneinfo.ZoneInfo('America/Santo_Domingo'),
-    )
+    if dt.month == 1:
+        return _month_floor(dt.year - 1, 12)
+    return _month_floor(dt.year, dt.month - 1)
 
 
 def current_year() -> datetime.datetime:
-    """Return datetime of the first day of last month."""
-    dt = now()
-    return datetime.datetime(
-        year=dt.year,
-        month=1,
-        day=1,
-        tzinfo=zoneinfo.ZoneInfo('America/Santo_Domingo'),
-    )
+    """Return datetime of the first day of the current year."""
+    return _month_floor(now().year, 1)
 
 
 def round_to_hour(dt: datetime.datetime) -> datetime.datetime:
@@ -74,7 +67,7 @@ def round_to_hour(dt: datetime.datetime) -> datetime.datetime:
 
 def round_to_day(dt: datetime.datetime) -> datetime.datetime:
     """Round datetime to day."""
-    return datetime.datetime.combine(dt, datetime.time.min)
+    return dt.replace(hour=0, minute=0, second=0, microsecond=0)
 
 
 def round_to_week(dt: datetime.datetime) -> datetime.datetime:
@@ -85,17 +78,12 @@ def round_to_week(dt: datetime.datetime) -> datetime.datetime:
 
 def round_to_month(dt: datetime.datetime) -> datetime.datetime:
     """Return datetime of the first day of the month of the given datetime."""
-    return datetime.datetime(
-        year=dt.year,
-        month=dt.month,
-        day=1,
-        tzinfo=zoneinfo.ZoneInfo('America/Santo_Domingo'),
-    )
+    return _month_floor(dt.year, dt.month)
 
 
 def convert_to_default_tz(dt: datetime.datetime) -> datetime.datetime:
     """Convert datetime to default timezone."""
-    return dt.astimezone(zoneinfo.ZoneInfo('America/Santo_Domingo'))
+    return dt.astimezone(_TZ)
 
 
 def today_hour(hour: int) -> datetime.datetime:
@@ -106,5 +94,5 @@ def today_hour(hour: int) -> datetime.datetime:
         month=dt.month,
         day=dt.day,
         hour=hour,
-        tzinfo=zoneinfo.ZoneInfo('America/Santo_Domingo'),
+        tzinfo=_TZ,
     )
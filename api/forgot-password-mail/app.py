@@ -1,39 +1,96 @@
+import concurrent.futures
+import copy
+import os
+import smtplib
+import threading
+from email.message import EmailMessage
+
 from flask import Flask, request, jsonify
-from flask_mail import Mail, Message
 from flask_cors import CORS
 
 app = Flask(__name__)
 CORS(app)
 
 # Configuración del correo
-app.config['MAIL_SERVER'] = 'smtp.gmail.com'
-app.config['MAIL_PORT'] = 587
+app.config['MAIL_SERVER'] = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
+app.config['MAIL_PORT'] = int(os.getenv('MAIL_PORT', '587'))
 app.config['MAIL_USE_TLS'] = True
-app.config['MAIL_USERNAME'] = 'heroefuerte136@gmail.com'
-app.config['MAIL_PASSWORD'] = 'yvod qgtf ukms szmt'  
+app.config['MAIL_USERNAME'] = os.getenv('MAIL_USERNAME')
+app.config['MAIL_PASSWORD'] = os.getenv('MAIL_PASSWORD')
+
+RESET_HTML = '''
+    <p>Click on the following link to reset your password:</p>
+    <a href="http://localhost:8080/reset-password" style="display: inline-block; padding: 10px 20px; font-size: 16px; text-align: center; text-decoration: none; color: white; background-color: #007bff; border-radius: 5px;">Reset Password</a>
+    '''
+
+
+class SMTPConnectionPool:
+    """Keeps one authenticated SMTP session and reconnects when it drops."""
+
+    def __init__(self, server, port, username, password):
+        self._server = server
+        self._port = port
+        self._username = username
+        self._password = password
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        conn = smtplib.SMTP(self._server, self._port)
+        conn.starttls()
+        conn.login(self._username, self._password)
+        return conn
+
+    def send(self, msg):
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            else:
+                try:
+                    self._conn.noop()
+                except smtplib.SMTPException:
+                    self._conn = self._connect()
+            try:
+                self._conn.send_message(msg)
+            except smtplib.SMTPException:
+                self._conn = self._connect()
+                self._conn.send_message(msg)
 
-mail = Mail(app)
+
+smtp_pool = SMTPConnectionPool(
+    app.config['MAIL_SERVER'],
+    app.config['MAIL_PORT'],
+    app.config['MAIL_USERNAME'],
+    app.config['MAIL_PASSWORD'],
+)
+app.extensions['smtp_pool'] = smtp_pool
+
+_MAIL_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+# Solo el destinatario cambia entre solicitudes
+_BASE_MSG = EmailMessage()
+_BASE_MSG['Subject'] = 'Password Reset Request'
+_BASE_MSG['From'] = f"Netolight Support <{app.config['MAIL_USERNAME']}>"
+_BASE_MSG.set_content(RESET_HTML, subtype='html')
+
+
+def _send_reset_mail(email):
+    # copy.copy compartiría la lista interna de cabeceras
+    msg = copy.deepcopy(_BASE_MSG)
+    msg['To'] = email
+    smtp_pool.send(msg)
 
 @app.route('/forgot-password', methods=['POST'])
 def forgot_password():
     data = request.get_json()
     email = data.get('email')
-    
+
     if not email:
         return jsonify({'error': 'Email is required'}), 400
-    
-    # Generar el contenido del correo con el enlace de redirección
-    msg = Message('Password Reset Request', sender=('Netolight Support', 'heroefuerte136@gmail.com'), recipients=[email])
-    msg.html = '''
-    <p>Click on the following link to reset your password:</p>
-    <a href="http://localhost:8080/reset-password" style="display: inline-block; padding: 10px 20px; font-size: 16px; text-align: center; text-decoration: none; color: white; background-color: #007bff; border-radius: 5px;">Reset Password</a>
-    '''
-    
-    try:
-        mail.send(msg)
-        return jsonify({'message': 'Password reset email sent'}), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+
+    # El envío corre en segundo plano para no bloquear el worker
+    _MAIL_EXEC.submit(_send_reset_mail, email)
+    return jsonify({'message': 'Password reset email queued'}), 202
 
 if __name__ == '__main__':
     app.run(port=5001)
@@ -1,8 +1,7 @@
-import asyncio
-
 import httpx
 import pytest
 import pytest_asyncio
+import sqlalchemy as sa
 
 import api.main
 import api.repositories
@@ -14,80 +13,85 @@ def anyio_backend():
     return 'asyncio'
 
 
-@pytest_asyncio.fixture(scope='session')
-def event_loop():
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture()
 def api_client():
     return httpx.AsyncClient(app=api.main.app, base_url='http://test')
 
 
-@pytest_asyncio.fixture()
+@pytest_asyncio.fixture(scope='session')
 async def db():
     async with api.postgres.get_session().begin() as db:
         yield db
 
 
-@pytest_asyncio.fixture()
+@pytest_asyncio.fixture(scope='session')
 async def streetlamp_repo(db):
     return api.repositories.StreetlampRepository(db)
 
 
-@pytest_asyncio.fixture()
+@pytest_asyncio.fixture(scope='session')
 async def sstate_repo(db):
     return api.repositories.StreetlampStateRepository(db)
 
 
-@pytest_asyncio.fixture()
+@pytest_asyncio.fixture(scope='session')
 async def salarm_repo(db):
     return api.repositories.StreetlampAlarmRepository(db)
 
 
-@pytest_asyncio.fixture()
+@pytest_asyncio.fixture(scope='session')
 async def streamst_repo(db):
     return api.repositories.StreamStateRepository(db)
 
 
-@pytest_asyncio.fixture()
+@pytest_asyncio.fixture(scope='session')
 async def hourly_state_repo(db):
     return api.repositories.HourlyStreetlampStateRepository(db)
 
 
-@pytest_asyncio.fixture()
+@pytest_asyncio.fixture(scope='session')
 async def daily_state_repo(db):
     return api.repositories.DailyStreetlampStateRepository(db)
 
 
-@pytest_asyncio.fixture()
+@pytest_asyncio.fixture(scope='session')
 async def weekly_state_repo(db):
     return api.repositories.WeeklyStreetlampStateRepository(db)
 
 
-@pytest_asyncio.fixture()
+@pytest_asyncio.fixture(scope='session')
 async def monthly_state_repo(db):
     return api.repositories.MonthlyStreetlampStateRepository(db)
 
 
+_TRUNCATE_ALL = sa.text(
+    'TRUNCATE TABLE '
+    'streetlamps, streetlamp_states, streetlamp_alarms, stream_states, '
+    'hourly_streetlamp_states, daily_streetlamp_states, '
+    'weekly_streetlamp_states, monthly_streetlamp_states '
+    'RESTART IDENTITY CASCADE'
+)
+
+
+@pytest_asyncio.fixture()
+async def clean_db(db):
+    await db.execute(_TRUNCATE_ALL)
+
+
 @pytest_asyncio.fixture()
-async def streetlamp_state_serv(db, sstate_repo, salarm_repo, streamst_repo):
+async def streetlamp_state_serv(clean_db, sstate_repo, salarm_repo, streamst_repo):
     serv = api.services.StreetlampStateService(
         sstate_repo=sstate_repo,
         stream_repo=streamst_repo,
         salarm_repo=salarm_repo,
     )
 
-    await sstate_repo.delete_all()
-    await streamst_repo.delete_all()
-
     yield serv
 
 
 @pytest_asyncio.fixture()
 async def streetlamp_hourly_agg_serv(
+    clean_db,
     streetlamp_repo,
     sstate_repo,
     streamst_repo,
@@ -100,15 +104,12 @@ async def streetlamp_hourly_agg_serv(
         hourly_state_repo=hourly_state_repo,
     )
 
-    await sstate_repo.delete_all()
-    await streamst_repo.delete_all()
-    await hourly_state_repo.delete_all()
-
     yield serv
 
 
 @pytest_asyncio.fixture()
 async def streetlamp_daily_agg_serv(
+    clean_db,
     streetlamp_repo,
     streamst_repo,
     hourly_state_repo,
@@ -121,15 +122,12 @@ async def streetlamp_daily_agg_serv(
         daily_state_repo=daily_state_repo,
     )
 
-    await streamst_repo.delete_all()
-    await hourly_state_repo.delete_all()
-    await daily_state_repo.delete_all()
-
     yield serv
 
 
 @pytest_asyncio.fixture()
 async def streetlamp_weekly_agg_serv(
+    clean_db,
     streetlamp_repo,
     streamst_repo,
     daily_state_repo,
@@ -142,15 +140,12 @@ async def streetlamp_weekly_agg_serv(
         weekly_state_repo=weekly_state_repo,
     )
 
-    await streamst_repo.delete_all()
-    await daily_state_repo.delete_all()
-    await weekly_state_repo.delete_all()
-
     yield serv
 
 
 @pytest_asyncio.fixture()
 async def streetlamp_monthly_agg_serv(
+    clean_db,
     streetlamp_repo,
     streamst_repo,
     daily_state_repo,
@@ -163,15 +158,12 @@ async def streetlamp_monthly_agg_serv(
         monthly_state_repo=monthly_state_repo,
     )
 
-    await streamst_repo.delete_all()
-    await daily_state_repo.delete_all()
-    await monthly_state_repo.delete_all()
-
     yield serv
 
 
 @pytest_asyncio.fixture()
 async def dashboard_serv(
+    clean_db,
     streetlamp_repo,
     salarm_repo,
     hourly_state_repo,
@@ -188,10 +180,4 @@ async def dashboard_serv(
         monthly_state_repo=monthly_state_repo,
     )
 
-    await streetlamp_repo.delete_all()
-    await salarm_repo.delete_all()
-    await daily_state_repo.delete_all()
-    await weekly_state_repo.delete_all()
-    await monthly_state_repo.delete_all()
-
     yield serv
@@ -1,8 +1,8 @@
 import calendar
 import datetime
+import functools
 import math
 import uuid
-import zoneinfo
 
 import api.repositories
 import api.schemas
@@ -10,6 +10,32 @@ import api.services
 import api.utils
 import pytest
 
+_UTC = datetime.timezone.utc
+_MIDNIGHT = datetime.time()
+
+
+_TENANT_ID = '52f14cd4-c6f1-4fbd-8f87-4025e1d49242'
+_TENANT_NAME = 'NetoLight'
+_APPLICATION_ID = 'c828e0b5-f1b7-4490-9678-59b3304070ef'
+_APPLICATION_NAME = 'NetoLight App'
+_DEVICE_PROFILE_ID = '77efb5fd-d36a-4eeb-b2c8-ad1a22256771'
+_DEVICE_PROFILE_NAME = 'NetoLight Default Profile'
+_DEV_ADDR = '006fdf37'
+
+
+@functools.lru_cache(maxsize=None)
+def _info(dev_eui: str) -> api.schemas.StreetlampInfo:
+    return api.schemas.StreetlampInfo(
+        tenantId=_TENANT_ID,
+        tenantName=_TENANT_NAME,
+        applicationId=_APPLICATION_ID,
+        applicationName=_APPLICATION_NAME,
+        deviceProfileId=_DEVICE_PROFILE_ID,
+        deviceProfileName=_DEVICE_PROFILE_NAME,
+        deviceName=f'NLPY{dev_eui}',
+        devEui=dev_eui,
+    )
+
 
 def gen_ss_sample(
     *,
@@ -20,14 +46,6 @@ def gen_ss_sample(
     status_on: bool,
 ):
     deduplication_id = str(uuid.uuid4())
-    tenant_id = '52f14cd4-c6f1-4fbd-8f87-4025e1d49242'
-    tenant_name = 'NetoLight'
-    application_id = 'c828e0b5-f1b7-4490-9678-59b3304070ef'
-    application_name = 'NetoLight App'
-    device_profile_id = '77efb5fd-d36a-4eeb-b2c8-ad1a22256771'
-    device_profile_name = 'NetoLight Default Profile'
-    device_name = f'NLPY{dev_eui}'
-    dev_addr = '006fdf37'
 
     sds = api.schemas.StreetlampDeviceState(
         voltage=239.6,
@@ -43,31 +61,22 @@ def gen_ss_sample(
         api.schemas.StreetlampStateCreate(
             deduplicationId=deduplication_id,
             time=time,
-            deviceInfo=api.schemas.StreetlampInfo(
-                tenantId=tenant_id,
-                tenantName=tenant_name,
-                applicationId=application_id,
-                applicationName=application_name,
-                deviceProfileId=device_profile_id,
-                deviceProfileName=device_profile_name,
-                deviceName=device_name,
-                devEui=dev_eui,
-            ),
-            devAddr=dev_addr,
+            deviceInfo=_info(dev_eui),
+            devAddr=_DEV_ADDR,
             data=api.services.encode_state_data(sds),
         ),
         lambda ssid: api.schemas.StreetlampState(
             id=ssid,
             time=time,
-            tenant_id=tenant_id,
-            tenant_name=tenant_name,
-            application_id=application_id,
-            application_name=application_name,
-            device_profile_id=device_profile_id,
-            device_profile_name=device_profile_name,
-            device_name=device_name,
+            tenant_id=_TENANT_ID,
+            tenant_name=_TENANT_NAME,
+            application_id=_APPLICATION_ID,
+            application_name=_APPLICATION_NAME,
+            device_profile_id=_DEVICE_PROFILE_ID,
+            device_profile_name=_DEVICE_PROFILE_NAME,
+            device_name=f'NLPY{dev_eui}',
             dev_eui=dev_eui,
-            dev_addr=dev_addr,
+            dev_addr=_DEV_ADDR,
             dev_voltage=sds.voltage,
             dev_current=sds.current,
             dev_energy_out=sds.energy_out,
@@ -162,21 +171,35 @@ async def test_aggregates(
     cal = calendar.Calendar()
     imd = list(cal.itermonthdates(r.year, r.month - 1))
     nd = len(imd) + r.day
-    t0 = datetime.datetime.combine(imd[0], datetime.datetime.min.time())
+    t0 = datetime.datetime.combine(imd[0], _MIDNIGHT)
     energy_in = 0
-    status_on = False
 
+    hour_axis = []
     for i in range(24 * nd):
+        t1 = t0 + datetime.timedelta(hours=i)
+        t2 = t1 + datetime.timedelta(
+            minutes=59, seconds=59, microseconds=999999
+        )
+        hour_axis.append(
+            (
+                t1.hour < 6 or t1.hour >= 18,
+                t1.astimezone(_UTC),
+                t2.astimezone(_UTC),
+            )
+        )
+
+    for i, (status_on, t1_utc, t2_utc) in enumerate(hour_axis):
+        ssc0s = []
+        ssc1s = []
         for s in ss:
-            t1 = t0 + datetime.timedelta(hours=i)
-            status_on = t1.hour < 6 or t1.hour >= 18
             energy_in = energy_in + 7500 if status_on else energy_in
             ssc0, _ = gen_ss_sample(
-                time=t1.astimezone(zoneinfo.ZoneInfo('UTC')),
+                time=t1_utc,
                 dev_eui=s.device_eui,
                 energy_in=energy_in,
                 status_on=status_on,
             )
+            ssc0s.append(ssc0)
             if (i + 1) % 24 == 0:
                 ssc00, _ = gen_ss_sample(
                     time=ssc0.time + datetime.timedelta(seconds=60),
@@ -185,22 +208,19 @@ async def test_aggregates(
                     power=100.0,
                     status_on=status_on,
                 )
-            status_on = t1.hour < 6 or t1.hour >= 18
+                ssc0s.append(ssc00)
             energy_in = energy_in + 7500 if status_on else energy_in
-            t2 = t1 + datetime.timedelta(
-                minutes=59, seconds=59, microseconds=999999
-            )
             ssc1, _ = gen_ss_sample(
-                time=t2.astimezone(zoneinfo.ZoneInfo('UTC')),
+                time=t2_utc,
                 dev_eui=s.device_eui,
                 energy_in=energy_in,
                 status_on=status_on,
             )
-            await streetlamp_state_serv.create(ssc0)
-            if (i + 1) % 24 == 0:
-                await streetlamp_state_serv.create(ssc00)
-            await streetlamp_hourly_agg_serv.aggregate()
-            await streetlamp_state_serv.create(ssc1)
+            ssc1s.append(ssc1)
+
+        await streetlamp_state_serv.create_many(ssc0s)
+        await streetlamp_hourly_agg_serv.aggregate()
+        await streetlamp_state_serv.create_many(ssc1s)
 
         if nd == (24 * nd) - 1:
             await streetlamp_state_serv.create(
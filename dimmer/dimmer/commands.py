@@ -1,65 +1,128 @@
+import atexit
 import base64
+import functools
 import os
 import grpc
 
 from chirpstack_api import api
-from google.protobuf.json_format import MessageToDict
 
 from .log import logger
 
 
+_ON_PAYLOAD = b'9529-ON'
+_OFF_PAYLOAD = b'9529-OF'
+_DIM_PAYLOAD = tuple(f'9529-DM{v}'.encode() for v in range(256))
+_DIM_GROUP_PAYLOAD = tuple(
+    f'9529-DM{str(v).zfill(3)}'.encode() for v in range(256)
+)
+
+_CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_permit_without_calls', 1),
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_channel():
+    """Create the shared ChirpStack channel on first use."""
+    channel = grpc.insecure_channel(
+        os.getenv('CHIRPSTACK_SERVER_URL'), options=_CHANNEL_OPTIONS
+    )
+    atexit.register(channel.close)
+    return channel
+
+
+@functools.lru_cache(maxsize=1)
+def _get_device_stub():
+    return api.DeviceServiceStub(_get_channel())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_group_stub():
+    return api.MulticastGroupServiceStub(_get_channel())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_token():
+    return [
+        ('authorization', f'Bearer {os.getenv("CHIRPSTACK_SERVER_JWT_TOKEN")}')
+    ]
+
+
 def enqueue_device_command(dev_eui: str, data: bytes, f_port: int = 2):
     """Enqueue a command to a device."""
-    channel = grpc.insecure_channel(os.getenv("CHIRPSTACK_SERVER_URL"))
-    token = [ ('authorization', f'Bearer {os.getenv("CHIRPSTACK_SERVER_JWT_TOKEN")}') ]
-    client = api.DeviceServiceStub(channel)
     req = api.EnqueueDeviceQueueItemRequest()
     req.queue_item.confirmed = False
     req.queue_item.dev_eui = dev_eui
     req.queue_item.data = data
     req.queue_item.f_port = f_port
-    resp = client.Enqueue(req, metadata=token)
-    return MessageToDict(resp)
+    return _get_device_stub().Enqueue(req, metadata=_get_token())
 
 
-def enqueue_group_command(mgid: str, data: bytes, f_port: int = 2) -> dict:
+def enqueue_group_command(mgid: str, data: bytes, f_port: int = 2):
     """Enqueue a message to a group of devices."""
-    channel = grpc.insecure_channel(os.getenv("CHIRPSTACK_SERVER_URL"))
-    token = [ ('authorization', f'Bearer {os.getenv("CHIRPSTACK_SERVER_JWT_TOKEN")}') ]
-    client = api.MulticastGroupServiceStub(channel)
     req = api.EnqueueMulticastGroupQueueItemRequest()
     req.queue_item.multicast_group_id = mgid
     req.queue_item.data = data
     req.queue_item.f_port = f_port
-    resp = client.Enqueue(req, metadata=token)
-    return MessageToDict(resp)
+    return _get_group_stub().Enqueue(req, metadata=_get_token())
+
+
+def enqueue_device_commands(items, f_port: int = 2):
+    """Enqueue commands to many devices over pipelined RPCs."""
+    stub = _get_device_stub()
+    token = _get_token()
+    futures = []
+    for dev_eui, data in items:
+        req = api.EnqueueDeviceQueueItemRequest()
+        req.queue_item.confirmed = False
+        req.queue_item.dev_eui = dev_eui
+        req.queue_item.data = data
+        req.queue_item.f_port = f_port
+        futures.append(stub.Enqueue.future(req, metadata=token))
+    return [f.result() for f in futures]
 
 
 def turn_on(dev_eui: str):
-    logger.debug(f'Sending command TURN_ON to device {dev_eui}')
-    return enqueue_device_command(dev_eui, b'9529-ON')
+    logger.debug('Sending command TURN_ON to device %s', dev_eui)
+    return enqueue_device_command(dev_eui, _ON_PAYLOAD).id
 
 
 def turn_off(dev_eui: str):
-    logger.debug(f'Sending command TURN_OFF to device {dev_eui}')
-    return enqueue_device_command(dev_eui, b'9529-OF')
+    logger.debug('Sending command TURN_OFF to device %s', dev_eui)
+    return enqueue_device_command(dev_eui, _OFF_PAYLOAD).id
 
 
 def dim(dev_eui: str, val: int):
-    logger.debug(f'Sending command DIM_{val} to device {dev_eui}')
-    return enqueue_device_command(dev_eui, bytes(f'9529-DM{val}', 'utf-8'))
+    logger.debug('Sending command DIM_%d to device %s', val, dev_eui)
+    return enqueue_device_command(dev_eui, _DIM_PAYLOAD[val]).id
+
+
+def turn_on_many(dev_euis):
+    logger.debug('Sending command TURN_ON to %d devices', len(dev_euis))
+    return enqueue_device_commands([(e, _ON_PAYLOAD) for e in dev_euis])
+
+
+def turn_off_many(dev_euis):
+    logger.debug('Sending command TURN_OFF to %d devices', len(dev_euis))
+    return enqueue_device_commands([(e, _OFF_PAYLOAD) for e in dev_euis])
+
+
+def dim_many(dev_euis, val: int):
+    logger.debug('Sending command DIM_%d to %d devices', val, len(dev_euis))
+    return enqueue_device_commands([(e, _DIM_PAYLOAD[val]) for e in dev_euis])
 
 
 def turn_on_group(mgid: str):
-    logger.debug(f'Sending command TURN_ON to group {mgid}')
-    return enqueue_group_command(mgid, b'9529-ON')
+    logger.debug('Sending command TURN_ON to group %s', mgid)
+    return enqueue_group_command(mgid, _ON_PAYLOAD)
 
 
 def turn_off_group(mgid: str):
-    logger.debug(f'Sending command TURN_OFF to group {mgid}')
-    return enqueue_group_command(mgid, b'9529-OF')
+    logger.debug('Sending command TURN_OFF to group %s', mgid)
+    return enqueue_group_command(mgid, _OFF_PAYLOAD)
 
 
 def dim_group(mgid: str, val: int):
-    logger.debug(f'Sending command DIM_{val} to group {mgid}')
-    return enqueue_group_command(mgid, bytes(f'9529-DM{str(val).zfill(3)}', 'utf-8'))
+    logger.debug('Sending command DIM_%d to group %s', val, mgid)
+    return enqueue_group_command(mgid, _DIM_GROUP_PAYLOAD[val])
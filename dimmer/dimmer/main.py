@@ -1,9 +1,11 @@
+import asyncio
 import logging
 import os
+import threading
 import rpyc
 
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from dotenv import load_dotenv
 from rpyc.utils.server import ThreadedServer
 
@@ -18,6 +20,18 @@ class SchedulerService(rpyc.Service):
     def exposed_add_job(self, func, *args, **kwargs):
         return scheduler.add_job(func, *args, **kwargs)
 
+    def exposed_add_jobs(self, specs):
+        return [
+            scheduler.add_job(
+                spec['cmd'],
+                'cron',
+                args=list(spec['args']),
+                hour=spec['hour'],
+                minute=spec['minute'],
+            ).id
+            for spec in specs
+        ]
+
     def exposed_modify_job(self, job_id, jobstore=None, **changes):
         return scheduler.modify_job(job_id, jobstore, **changes)
 
@@ -42,7 +56,10 @@ class SchedulerService(rpyc.Service):
 
 if __name__ == '__main__':
 
-    scheduler = BackgroundScheduler(jobstores={
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    scheduler = AsyncIOScheduler(jobstores={
         'default': SQLAlchemyJobStore(url=SQLALCHEMY_URL)
     })
     scheduler.start()
@@ -51,14 +68,18 @@ if __name__ == '__main__':
     server = ThreadedServer(SchedulerService,
                             port=os.getenv('NL_DIMMER_PORT'),
                             protocol_config=proto_cfg)
+    server_thread = threading.Thread(target=server.start, daemon=True)
+    server_thread.start()
 
     logger.info('dimmer started')
 
     try:
-        server.start()
+        loop.run_forever()
     except (KeyboardInterrupt, SystemExit):
         pass
     finally:
-        scheduler.shutdown()
+        scheduler.shutdown(wait=False)
+        server.close()
+        loop.close()
 
     logger.info('dimmer stopped')